@@ -1,16 +1,16 @@
-import tkinter as tk
-from gui.main_menu import MainMenuGUI
 import sys
 from pathlib import Path
 
-# Add parent directory for imports
-sys.path.append(str(Path(__file__).parent))
+# Make the project packages (core, gui, voice) importable from anywhere
+PROJECT_ROOT = str(Path(__file__).resolve().parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 
 def main():
     """Main entry point for DeskPilot"""
     try:
-        # Just create and start the app
+        # Imported here so the GUI stack only loads when the app actually starts
         from gui.main_menu import MainMenuGUI
         app = MainMenuGUI()
         app.run()
@@ -19,9 +19,6 @@ def main():
         import traceback
         traceback.print_exc()
 
-if __name__ == "__main__":
-    main()
-
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
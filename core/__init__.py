@@ -0,0 +1 @@
+"""DeskPilot core logic: app launching, file summarising and desktop organising."""
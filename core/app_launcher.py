@@ -2,24 +2,339 @@
 import subprocess
 import platform
 import psutil
-import sys
 import os
 import time
 import re
 import difflib
+import functools
+import select
+import threading
+import atexit
+import plistlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+# RapidFuzz (optional): C++ fuzzy matching, far faster than difflib; difflib stays as the fallback
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz, utils as rf_utils
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# pyahocorasick (optional): matches every system-process pattern in one pass over a name
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # No more voice imports - app_launcher stays silent
 
+# Resolved once at import; the OS doesn't change while we're running
+_PLATFORM = platform.system()
+
+# Casefolded names of system/background processes hidden from running-app lists
+_SYSTEM_PROCS_EXACT = frozenset(name.casefold() for name in (
+    # macOS core/background
+    'kernel_task', 'launchd', 'WindowServer', 'Dock', 'loginwindow',
+    # Windows core
+    'svchost.exe', 'explorer.exe', 'winlogon.exe', 'csrss.exe',
+))
+# Linux core daemons that come in families ('ksoftirqd/0', 'systemd-journald'), so matched as substrings
+_SYSTEM_PROCS_SUBSTR = tuple(name.casefold() for name in ('systemd', 'kthreadd', 'ksoftirqd'))
+
+# Automaton over the substring tier, so the check stays O(len(name)) however long the list grows
+_SYSTEM_PROCS_AC = None
+if AHOCORASICK_AVAILABLE:
+    _SYSTEM_PROCS_AC = ahocorasick.Automaton()
+    for _pattern in _SYSTEM_PROCS_SUBSTR:
+        _SYSTEM_PROCS_AC.add_word(_pattern, _pattern)
+    _SYSTEM_PROCS_AC.make_automaton()
+
+# Background items System Events can still report as foreground apps
+_GUI_BANNED = frozenset(name.casefold() for name in ("Dock", "WindowServer", "loginwindow"))
+
+# Launched apps don't need our stdio
+_POPEN_KW = {
+    'stdin': subprocess.DEVNULL,
+    'stdout': subprocess.DEVNULL,
+    'stderr': subprocess.DEVNULL,
+}
+if _PLATFORM != "Windows":
+    # Detach the child into its own session and skip the fd-closing sweep (we hold no sensitive fds)
+    _POPEN_KW.update(close_fds=False, start_new_session=True)
+
+# posix_spawn file actions pointing the child's stdio at /dev/null
+_SPAWN_FILE_ACTIONS = [
+    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+] if hasattr(os, "posix_spawnp") else None
+
+# Children started via posix_spawnp that haven't been reaped yet
+_spawned_pids = []
+
+
+def _reap_spawned():
+    """Collect exit statuses of finished spawned children so they don't linger as zombies."""
+    for pid in _spawned_pids[:]:
+        try:
+            done, _status = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            done = pid
+        if done:
+            _spawned_pids.remove(pid)
+
+
+def _spawn(argv):
+    """
+    Start argv detached from DeskPilot.
+    On POSIX uses posix_spawnp, which avoids duplicating our (large) page tables the way fork() does;
+    elsewhere falls back to subprocess.Popen. Raises OSError if the program can't be started.
+    """
+    if _SPAWN_FILE_ACTIONS is None:
+        return subprocess.Popen(argv, **_POPEN_KW).pid
+    _reap_spawned()
+    pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=_SPAWN_FILE_ACTIONS, setsid=True)
+    _spawned_pids.append(pid)
+    return pid
+
+
+# Spoken verbs that introduce an app name in voice commands
+_OPEN_VERBS = ('open', 'launch', 'start', 'run', 'bring up', 'pull up', 'fire up', 'boot up', 'pop open')
+_QUIT_VERBS = ('quit', 'close', 'stop', 'exit', 'kill', 'shut down', 'close out', 'end', 'terminate', 'dismiss')
+
+
+def _verb_regex(verbs):
+    """Compile one '<verb> <app>' pattern; longest verbs first so 'close out' beats 'close'."""
+    alternation = "|".join(re.escape(v) for v in sorted(verbs, key=len, reverse=True))
+    return re.compile(r"\b(" + alternation + r")\s+(.+)$")
+
+
+_OPEN_VERB_RE = _verb_regex(_OPEN_VERBS)
+_QUIT_VERB_RE = _verb_regex(_QUIT_VERBS)
+
+# Single-word fallbacks when no verb pattern matched
+_OPEN_TRIGGERS = frozenset({'open', 'launch', 'start', 'run'})
+_QUIT_TRIGGERS = frozenset({'quit', 'close', 'stop', 'exit', 'kill'})
+
+# Polite/filler phrases stripped before isolating the app name
+_FILLERS_RE = re.compile(r"\b(could you|would you|can you|please|be a dear and|go ahead and|would you mind|do me a favour and|do me a favor and|for me|for my deskpilot|deskpilot|the|my|a|an|app|application)\b")
+
+# "is <app> (currently) open/running?"
+_IS_RUNNING_RE = re.compile(r"^\s*is\s+(.+?)\s+(?:currently\s+)?(open|running)\??\s*$")
+
+# Name normalization and general text cleanup
+_NORMALIZE_PUNCT_RE = re.compile(r"[\._]")
+_NORMALIZE_WORDS_RE = re.compile(r"\b(app|application|the)\b")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_WS_RE = re.compile(r"\s+")
+
+# osascript joins lists with ", " and sometimes newlines
+_OSA_LIST_SPLIT_RE = re.compile(r",\s*|\n+")
+
+# Phrases that ask for a list of running apps rather than launching one
+_LIST_TRIGGERS = (
+    "which apps", "which applications", "what apps", "what applications",
+    "what's open", "what is open", "what's running", "what is running",
+    "show apps", "list apps", "running apps", "running applications", "currently running apps", "rundown"
+)
+_LIST_TRIGGER_RE = re.compile("|".join(re.escape(t) for t in _LIST_TRIGGERS))
+
+# "how many apps/applications are open/running" in any word order
+_HOWMANY_RE = re.compile(r"^(?=.*how many)(?=.*app)(?=.*(?:open|running))", re.DOTALL)
+
+# Linux /proc/<pid>/comm holds at most this many chars (TASK_COMM_LEN - 1)
+_COMM_MAX_LEN = 15
+
+# Seconds a process-table snapshot stays valid; nobody issues voice commands faster than this
+_PROC_CACHE_TTL = 0.75
+
+# macOS launcher; an absolute path skips the PATH search on every launch
+_OPEN_BIN = "/usr/bin/open"
+
+# AppleScript runner, and how long to wait on the persistent interpreter before giving up on it
+_OSA_BIN = "/usr/bin/osascript"
+_OSA_TIMEOUT = 3.0
+# Evaluated after each command so we know where its output ends
+_OSA_SENTINEL = '"__deskpilot_osa_done__"'
+
+# Spotlight query listing every indexed application bundle
+_MDFIND_BIN = "/usr/bin/mdfind"
+_MDFIND_QUERY = "kMDItemContentType == 'com.apple.application-bundle'"
+
+# Seconds the installed-apps scan is reused; /Applications rarely changes
+_APPS_CACHE_TTL = 600
+
+# Seconds an "is <app> running?" answer is reused
+_RUNNING_CACHE_TTL = 0.5
+
+# Seconds the running-apps list is reused (one osascript spawn on macOS), for back-to-back queries
+_RUNNING_APPS_TTL = 2.0
+
+
+def _process_names():
+    """
+    Yield (pid, name) for every running process.
+    On Linux reads /proc/<pid>/comm directly, skipping psutil.Process construction and
+    /proc/<pid>/stat parsing. The kernel truncates comm to 15 chars, so names that long are
+    resolved through psutil's name(), which recovers the full name from cmdline.
+    """
+    if _PLATFORM == "Linux":
+        for pid in psutil.pids():
+            try:
+                with open(f"/proc/{pid}/comm", encoding="utf-8", errors="replace") as f:
+                    name = f.read().rstrip("\n")
+                if len(name) >= _COMM_MAX_LEN:
+                    name = psutil.Process(pid).name() or name
+            except (OSError, psutil.NoSuchProcess, psutil.AccessDenied):
+                # Process exited meanwhile, or /proc is mounted with hidepid
+                continue
+            yield pid, name
+        return
+
+    # Attr-less iteration skips psutil's per-process as_dict() machinery; we only need the name
+    for proc in psutil.process_iter():
+        try:
+            yield proc.pid, proc.name() or ''
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+
+@functools.lru_cache(maxsize=2048)
+def _is_system_process_name(app_name):
+    """Memoized system-process check; process names recur across enumerations."""
+    # Do NOT filter Finder or common GUI utilities; user expects to see them.
+    name_cf = app_name.casefold()
+    if name_cf in _SYSTEM_PROCS_EXACT:
+        return True
+    if _SYSTEM_PROCS_AC is not None:
+        return next(_SYSTEM_PROCS_AC.iter(name_cf), None) is not None
+    return any(sys_proc in name_cf for sys_proc in _SYSTEM_PROCS_SUBSTR)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_name(name: str) -> str:
+    """Canonical form of an app name/query; memoized since aliases and queries repeat."""
+    s = name.lower().strip()
+    s = _NORMALIZE_PUNCT_RE.sub(" ", s)
+    s = _NORMALIZE_WORDS_RE.sub(" ", s)
+    s = s.replace("&", " and ")
+    s = s.replace("ms ", "microsoft ")
+    s = s.replace("vs code", "visual studio code")
+    s = _NON_ALNUM_RE.sub(" ", s)
+    s = _WS_RE.sub(" ", s).strip()
+    return s
+
+
+def _find_app_bundles(root, depth=2):
+    """
+    Yield (display name, path) for .app bundles under root.
+    Never descends into a bundle (its Contents/ holds thousands of files) and only recurses
+    depth levels into plain folders, enough for e.g. /Applications/Utilities/Foo.app.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".app"):
+                yield name[:-4], entry.path
+            elif depth > 0 and entry.is_dir(follow_symlinks=False):
+                try:
+                    yield from _find_app_bundles(entry.path, depth - 1)
+                except OSError:
+                    # Unreadable sub-folder; skip it but keep scanning siblings
+                    continue
+
+
+def _spotlight_app_bundles(roots):
+    """
+    Return (display name, path) for .app bundles Spotlight has indexed under roots.
+    One mdfind call reads the metadata store instead of walking folders. Returns [] if Spotlight
+    is unavailable, so callers can fall back to _find_app_bundles.
+    """
+    if not roots:
+        return []
+    try:
+        res = subprocess.run([_MDFIND_BIN, _MDFIND_QUERY], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return []
+    prefixes = [root.rstrip("/") + "/" for root in roots]
+    bundles = []
+    for path in res.stdout.splitlines():
+        parent, name = os.path.split(path)
+        # Skip helper apps nested inside other bundles (e.g. Chrome's Frameworks)
+        if not name.endswith(".app") or ".app/" in parent + "/":
+            continue
+        rank = next((i for i, prefix in enumerate(prefixes) if path.startswith(prefix)), None)
+        if rank is not None:
+            bundles.append((rank, name[:-4], path))
+    # Search-location order decides which copy of a duplicated app wins, as with the folder walk
+    bundles.sort(key=lambda b: b[0])
+    return [(display, path) for _rank, display, path in bundles]
+
+
+def _bundle_names(app_path):
+    """CFBundleDisplayName/CFBundleName from a bundle's Info.plist (empty if unreadable)."""
+    try:
+        with open(os.path.join(app_path, "Contents", "Info.plist"), "rb") as f:
+            info = plistlib.load(f)
+    except Exception:
+        return ()
+    return tuple(n for n in (info.get("CFBundleDisplayName"), info.get("CFBundleName")) if isinstance(n, str))
+
+
+def _unique_casefold(names):
+    """Drop case-insensitive repeats, keeping each name's first spelling and the original order."""
+    first = {}
+    for name in names:
+        first.setdefault(name.casefold(), name)
+    return list(first.values())
+
+
+def _join_names(names):
+    """Join names for speech: 'A', 'A and B', 'A, B and C'."""
+    if len(names) == 1:
+        return names[0]
+    return ", ".join(names[:-1]) + f" and {names[-1]}"
+
 
 class AppLauncher:
     """Handle launching, quitting, and managing applications WITHOUT voice feedback"""
 
+    # One interactive osascript shared by every launcher, started on first use
+    _osa = None
+    _osa_lock = threading.Lock()
+    _osa_disabled = False
+
+    # Installed-apps scan shared by every instance, so a stray AppLauncher() still hits the warm cache
+    _apps_cache = None
+    _apps_cache_time = 0.0
+    # One rebuild at a time: a caller arriving mid-scan (background warm-up vs. a button click) waits for it
+    _scan_lock = threading.Lock()
+    _token_index = {}
+    _app_bundles = ()
+    # Fuzzy-match catalog built with the scan: parallel lists of display names and (display, path)
+    _fuzzy_choices = []
+    _fuzzy_targets = []
+    # Aliases from Info.plist bundle names; read lazily, only once a query misses every file name
+    _bundle_aliases = None
+
     def __init__(self):
-        self.system = platform.system()
+        self.system = _PLATFORM
+        # App folders that actually exist, checked once rather than on every scan
+        self._search_locations = [loc for loc in self._app_search_locations() if os.path.isdir(loc)]
+        # Short-lived process snapshot shared by quit/is-running/list calls
+        self._proc_cache = None
+        self._proc_by_lower_name = {}
+        self._proc_cache_ts = 0.0
+        # {app name: (timestamp, running)} for _is_app_running
+        self._running_cache = {}
+        # (timestamp, sorted app names) for speak_running_apps
+        self._running_apps_cache = None
+        # Memoized resolutions keyed on the normalized query; reset whenever the app scan rebuilds
+        self._resolve_cached = functools.lru_cache(maxsize=256)(self._resolve_uncached)
+        self._resolved_scan_time = None
 
     def open_application(self, app_name):
         """
@@ -38,33 +353,23 @@ class AppLauncher:
                 if resolved:
                     display_name, app_path, _score = resolved
                     # If already running, bring to front instead of reopening
-                    if self._is_app_running(display_name):
-                        self.activate_application(display_name)
+                    if self._activate_if_running(display_name):
                         print(f"Focusing {display_name} (already running)...")
                         return True
-                    try:
-                        # Prefer opening by exact bundle path for reliability
-                        subprocess.Popen(["open", app_path])
-                        print(f"Opening {display_name}...")
-                        return True
-                    except Exception:
-                        # Fallback to using -a with display name
-                        subprocess.Popen(["open", "-a", display_name])
-                        print(f"Opening {display_name}...")
-                        return True
+                    return self._open_resolved(display_name, app_path)
                 else:
                     # Last resort: try to open what user said
-                    subprocess.Popen(["open", "-a", app_name])
+                    _spawn([_OPEN_BIN, "-a", app_name])
                     print(f"Opening {app_name}...")
                     return True
 
             elif self.system == "Windows":
-                subprocess.Popen([app_name])
+                _spawn([app_name])
                 print(f"Opening {app_name}...")
                 return True
 
             elif self.system == "Linux":
-                subprocess.Popen([app_name.lower()])
+                _spawn([app_name.lower()])
                 print(f"Opening {app_name}...")
                 return True
 
@@ -72,6 +377,13 @@ class AppLauncher:
             print(f"Error launching {app_name}: {e}")
             return False
 
+    def _open_resolved(self, display_name, app_path):
+        """Launch an app that _resolve_application already matched (macOS)."""
+        # Open by exact bundle path for reliability; a failure to start `open` raises to the caller
+        _spawn([_OPEN_BIN, app_path])
+        print(f"Opening {display_name}...")
+        return True
+
     def quit_application(self, app_name):
         """
         Quit an application by name (silent operation)
@@ -91,35 +403,79 @@ class AppLauncher:
             if self.system == "Darwin":
                 if self._is_app_running(target_name):
                     try:
-                        subprocess.run([
-                            "osascript", "-e", f'tell application "{target_name}" to quit'
-                        ], check=False)
-                        # Give it a moment then verify
+                        # One-shot: a "Save changes?" sheet can hold the quit well past _OSA_TIMEOUT
+                        self._run_osa(f'tell application "{target_name}" to quit', persistent=False)
+                        # Give it a moment then verify against fresh state
                         time.sleep(0.5)
+                        self.cache_clear()
                         if not self._is_app_running(target_name):
                             print(f"Quit {target_name}")
                             return True
                     except Exception:
                         pass
 
-            # Generic fallback: find and terminate process
-            for proc in psutil.process_iter(['pid', 'name']):
+            # Generic fallback: terminate every matching process (main app plus helpers) in one sweep
+            targets = []
+            for pid, proc_name in self._quit_target_pids(target_name):
                 try:
-                    proc_name = (proc.info['name'] or '').lower()
-                    if self._matches_process_name(proc_name, target_name):
-                        proc.terminate()
-                        print(f"Quit {target_name} (process: {proc.info['name']})")
-                        return True
+                    proc = psutil.Process(pid)
+                    # The snapshot can be _PROC_CACHE_TTL old; skip a pid that now belongs to another program
+                    if (proc.name() or '').lower() != proc_name:
+                        continue
+                    proc.terminate()
+                    targets.append(proc)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
-            print(f"{target_name} is not currently running")
-            return False
+            if not targets:
+                print(f"{target_name} is not currently running")
+                return False
+
+            _gone, alive = psutil.wait_procs(targets, timeout=2)
+            for proc in alive:
+                try:
+                    proc.kill()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            print(f"Quit {target_name} ({len(targets)} process(es))")
+            # Our snapshot and psutil's own process_iter cache still list the terminated processes
+            self.cache_clear()
+            psutil.process_iter.cache_clear()
+            return True
 
         except Exception as e:
             print(f"Error quitting {app_name}: {e}")
             return False
 
+    def _quit_target_pids(self, target_name: str):
+        """
+        (pid, lowercase snapshot name) of processes belonging to target_name, never including DeskPilot itself.
+        Whole-name matches win ("google chrome" covers Chrome's helpers); the first-word
+        variant is only tried if nothing matched, so quitting Chrome doesn't take down Google Drive.
+        """
+        tn = target_name.lower()
+        words = tn.split()
+        tiers = ((tn, tn.replace(" ", "")), (words[0] if words else '',))
+        index = self._proc_index()
+        own_pid = os.getpid()
+        for tier in tiers:
+            needles = tuple(n for n in tier if n)
+            if not needles:
+                continue
+            min_len = min(map(len, needles))
+            # Match against each distinct name once rather than every process sharing it
+            pids = [
+                (pid, proc_name)
+                for proc_name, name_pids in index.items()
+                # Fast reject: a name shorter than every needle can't contain one
+                if len(proc_name) >= min_len and self._matches_process_name(proc_name, needles)
+                for pid in name_pids
+                if pid != own_pid
+            ]
+            if pids:
+                return pids
+        return []
+
     # ----------------- Dynamic App Discovery & Resolution (macOS focused) -----------------
     def _app_search_locations(self):
         if self.system != "Darwin":
@@ -134,15 +490,7 @@ class AppLauncher:
         ]
 
     def _normalize(self, name: str) -> str:
-        s = name.lower().strip()
-        s = re.sub(r"[\._]", " ", s)
-        s = re.sub(r"\b(app|application|the)\b", " ", s)
-        s = s.replace("&", " and ")
-        s = s.replace("ms ", "microsoft ")
-        s = s.replace("vs code", "visual studio code")
-        s = re.sub(r"[^a-z0-9]+", " ", s)
-        s = re.sub(r"\s+", " ", s).strip()
-        return s
+        return _normalize_name(name)
 
     def _collect_aliases(self, display_name: str):
         base = self._normalize(display_name)
@@ -157,37 +505,101 @@ class AppLauncher:
         return aliases
 
     def _scan_installed_apps(self):
-        if getattr(self, "_apps_cache", None) and (time.time() - getattr(self, "_apps_cache_time", 0) < 60):
-            return self._apps_cache
-
+        cls = AppLauncher
+        if cls._apps_cache is not None and time.time() - cls._apps_cache_time < _APPS_CACHE_TTL:
+            return cls._apps_cache
+        with cls._scan_lock:
+            # Another thread may have finished the rebuild while we waited
+            if cls._apps_cache is not None and time.time() - cls._apps_cache_time < _APPS_CACHE_TTL:
+                return cls._apps_cache
+            return self._rebuild_apps_cache()
+
+    def _rebuild_apps_cache(self):
+        """Scan installed apps and publish the alias map, token index and fuzzy catalog (hold _scan_lock)."""
+        cls = AppLauncher
         apps = {}
+        bundles = []
         if self.system == "Darwin":
-            for loc in self._app_search_locations():
-                p = Path(loc)
-                if not p.exists():
-                    continue
-                # Use rglob to find .app bundles
-                try:
-                    for app in p.rglob("*.app"):
-                        display = app.stem
-                        aliases = self._collect_aliases(display)
-                        for alias in aliases:
-                            # Keep the first encountered path for an alias
-                            apps.setdefault(alias, (display, str(app)))
-                except Exception:
-                    continue
+            # Spotlight answers from its index in one call; walk the folders if it's off or empty
+            bundles = _spotlight_app_bundles(self._search_locations) or self._walk_app_bundles()
+            for display, app_path in bundles:
+                for alias in self._collect_aliases(display):
+                    # Keep the first encountered path for an alias
+                    apps.setdefault(alias, (display, app_path))
         else:
             # For other OS, we can't reliably scan generically; leave empty
             pass
 
-        self._apps_cache = apps
-        self._apps_cache_time = time.time()
+        # token -> aliases containing it, for the word-containment step of resolution
+        token_index = {}
+        for alias in apps:
+            for token in alias.split():
+                token_index.setdefault(token, set()).add(alias)
+
+        cls._apps_cache = apps
+        cls._token_index = token_index
+        cls._app_bundles = tuple(bundles)
+
+        # One entry per display name, with its choice string pre-processed once here rather than per query
+        targets = {}
+        for display, app_path in apps.values():
+            targets.setdefault(display, (display, app_path))
+        cls._fuzzy_targets = list(targets.values())
+        if RAPIDFUZZ_AVAILABLE:
+            cls._fuzzy_choices = [rf_utils.default_process(display) for display in targets]
+        else:
+            cls._fuzzy_choices = [display.lower() for display in targets]
+        cls._bundle_aliases = None
+        cls._apps_cache_time = time.time()
         return apps
 
+    def _walk_app_bundles(self):
+        """Folder-walk fallback for _scan_installed_apps."""
+        bundles = []
+        for loc in self._search_locations:
+            try:
+                bundles.extend(_find_app_bundles(loc))
+            except OSError:
+                continue
+        return bundles
+
+    def _bundle_name_index(self):
+        """
+        {normalized bundle name: (display, path)} for apps whose Info.plist name differs from
+        the file name (e.g. "Code" for Visual Studio Code.app). Built on first use per scan.
+        """
+        cls = AppLauncher
+        if cls._bundle_aliases is None:
+            index = {}
+            for display, app_path in cls._app_bundles:
+                stem = self._normalize(display)
+                for bundle_name in _bundle_names(app_path):
+                    alias = self._normalize(bundle_name)
+                    if alias and alias != stem:
+                        index.setdefault(alias, (display, app_path))
+            cls._bundle_aliases = index
+        return cls._bundle_aliases
+
     def _resolve_application(self, query: str):
         if not query:
             return None
-        norm_q = self._normalize(query)
+        return self._resolve_normalized(self._normalize(query), query.lower())
+
+    def _resolve_normalized(self, norm_q: str, query_l: str = None):
+        """
+        Resolve a query the caller already normalized with _normalize, so voice commands
+        don't repeat the normalization passes. query_l is the lowercased raw phrase for fuzzy matching.
+        """
+        # Refresh the scan first so a rebuild can invalidate stale cached resolutions
+        self._scan_installed_apps()
+        if self._resolved_scan_time != AppLauncher._apps_cache_time:
+            # Previous resolutions may point at apps that are gone (or miss new ones)
+            self._resolve_cached.cache_clear()
+            self._resolved_scan_time = AppLauncher._apps_cache_time
+        return self._resolve_cached(norm_q, query_l if query_l is not None else norm_q)
+
+    def _resolve_uncached(self, norm_q: str, query_l: str):
+        """Resolve a normalized query (plus its lowercased raw form for fuzzy matching)."""
         apps = self._scan_installed_apps()
 
         # 1. Exact alias match
@@ -201,43 +613,92 @@ class AppLauncher:
             display, path = apps[key2]
             return (display, path, 0.95)
 
+        # 2b. Bundle names from Info.plist, for apps whose file name isn't what people call them
+        bundle_aliases = self._bundle_name_index()
+        hit = bundle_aliases.get(norm_q) or bundle_aliases.get(key2)
+        if hit:
+            display, path = hit
+            return (display, path, 0.95)
+
         # 3. Word containment score
-        candidates = []
+        # Ties prefer whole-word hits, then the shortest alias, so "note" picks Notes over OneNote
+        # A query word never contains a space, so "w in alias" holds exactly when w is inside one
+        # of the alias's tokens: scan the (small) token vocabulary instead of every alias.
+        token_index = self._token_index
         q_words = norm_q.split()
-        for alias, (display, path) in apps.items():
-            score = sum(1 for w in q_words if w in alias) / max(1, len(q_words))
+        hits = Counter()
+        for w in q_words:
+            matched = set()
+            for token, aliases in token_index.items():
+                if w in token:
+                    matched |= aliases
+            hits.update(matched)
+
+        candidates = []
+        for alias, count in hits.items():
+            score = count / len(q_words)
             if score >= 0.6:  # threshold
-                candidates.append((score, display, path))
+                display, path = apps[alias]
+                whole_words = sum(1 for w in q_words if alias in token_index.get(w, ()))
+                candidates.append((score, whole_words, -len(alias), display, path))
 
         if candidates:
-            candidates.sort(reverse=True)
-            score, display, path = candidates[0]
+            score, _whole, _len, display, path = max(candidates)
             return (display, path, score)
 
-        # 4. Fuzzy fallback with difflib against display names
-        display_names = list({v[0] for v in apps.values()})
-        matches = difflib.get_close_matches(query, display_names, n=1, cutoff=0.6)
+        # 4. Fuzzy fallback against display names
+        choices = self._fuzzy_choices
+        if RAPIDFUZZ_AVAILABLE:
+            # Plain ratio at difflib's 0.6 cutoff; WRatio's partial/token-set scaling rates short
+            # queries highly against unrelated names. Choices are pre-processed.
+            match = rf_process.extractOne(
+                rf_utils.default_process(query_l), choices, scorer=rf_fuzz.ratio,
+                processor=None, score_cutoff=60
+            )
+            if match:
+                _choice, score, idx = match
+                display, path = self._fuzzy_targets[idx]
+                return (display, path, score / 100)
+            return None
+
+        # difflib: compare case-insensitively; voice input arrives lowercased, bundle names keep
+        # their own casing ("iTunes"), and we return the original display name untouched
+        matches = difflib.get_close_matches(query_l, choices, n=1, cutoff=0.6)
         if matches:
-            # find path for matched display
-            target = matches[0]
-            for alias, (display, path) in apps.items():
-                if display == target:
-                    return (display, path, 0.7)
+            display, path = self._fuzzy_targets[choices.index(matches[0])]
+            return (display, path, 0.7)
 
         return None
 
     def _is_app_running(self, name: str) -> bool:
         """
         Determine if an application is running.
-        - On macOS, prefer System Events via AppleScript for precise GUI app checks.
+        Results are reused for _RUNNING_CACHE_TTL seconds so the back-to-back checks a single
+        voice command makes (resolve -> is running -> activate) cost one lookup.
+        """
+        now = time.monotonic()
+        cached = self._running_cache.get(name)
+        if cached and now - cached[0] < _RUNNING_CACHE_TTL:
+            return cached[1]
+        running = self._check_app_running(name)
+        self._running_cache[name] = (now, running)
+        return running
+
+    def _check_app_running(self, name: str) -> bool:
+        """
+        Uncached running check.
+        - On macOS, try pgrep first (no AppleScript runtime), then System Events for GUI apps
+          whose process name differs from the display name.
         - Fallback to psutil for other OSes or if AppleScript fails.
         """
         try:
             if self.system == 'Darwin':
+                res = subprocess.run(["/usr/bin/pgrep", "-xi", name], capture_output=True, text=True)
+                if res.returncode == 0:
+                    return True
                 # Use System Events to check for an application process by display name
                 script = f'tell application "System Events" to (exists application process "{name}")'
-                res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True)
-                out = (res.stdout or '').strip().lower()
+                out = self._run_osa(script).lower()
                 if out in ('true', 'false'):
                     return out == 'true'
                 # If AppleScript didn't return a boolean, fall back to psutil below
@@ -245,35 +706,74 @@ class AppLauncher:
             # Fall back to psutil path if AppleScript fails
             pass
 
-        name_l = name.lower()
-        for proc in psutil.process_iter(['name']):
-            try:
-                proc_name = (proc.info['name'] or '').lower()
-                if self._matches_process_name(proc_name, name_l):
-                    return True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return False
+        needles = self._process_name_needles(name)
+        if self._proc_cache is not None and time.monotonic() - self._proc_cache_ts < _PROC_CACHE_TTL:
+            proc_names = self._proc_by_lower_name
+        else:
+            # No fresh snapshot: stream names and stop at the first match instead of enumerating everything
+            proc_names = (proc_name.lower() for _pid, proc_name in _process_names())
+        return any(self._matches_process_name(proc_name, needles) for proc_name in proc_names)
 
-    def _matches_process_name(self, proc_name: str, target_name: str) -> bool:
+    def _iter_procs(self):
+        """
+        Return a snapshot of running processes as (lowercase name, name, pid) tuples.
+        The snapshot is reused for _PROC_CACHE_TTL seconds so back-to-back commands
+        don't walk the whole process table again.
+        """
+        now = time.monotonic()
+        if self._proc_cache is not None and now - self._proc_cache_ts < _PROC_CACHE_TTL:
+            return self._proc_cache
+
+        procs = []
+        by_name = {}
+        for pid, name in _process_names():
+            name_l = name.lower()
+            procs.append((name_l, name, pid))
+            by_name.setdefault(name_l, []).append(pid)
+
+        self._proc_cache = procs
+        self._proc_by_lower_name = by_name
+        self._proc_cache_ts = now
+        return procs
+
+    def _proc_index(self):
+        """Return the snapshot grouped as {lowercase name: [pids]} (refreshed with _iter_procs)."""
+        self._iter_procs()
+        return self._proc_by_lower_name
+
+    def cache_clear(self):
+        """Drop the cached process snapshot and running checks so the next lookup re-enumerates."""
+        self._proc_cache = None
+        self._proc_by_lower_name = {}
+        self._proc_cache_ts = 0.0
+        self._running_cache.clear()
+        self._running_apps_cache = None
+
+    def _process_name_needles(self, target_name: str):
+        """Lowercased substrings that identify target_name in a process name; build once per lookup."""
         tn = target_name.lower()
-        variants = {tn, tn.replace(" ", ""), tn.split()[0]}
-        return any(v and v in proc_name for v in variants)
+        words = tn.split()
+        variants = {tn, tn.replace(" ", ""), words[0] if words else ''}
+        return tuple(v for v in variants if v)
+
+    def _matches_process_name(self, proc_name: str, needles) -> bool:
+        return any(n in proc_name for n in needles)
 
-    def activate_application(self, app_name: str) -> bool:
+    def activate_application(self, app_name: str, resolved: bool = False) -> bool:
         """
         Bring an already running application to the foreground/focus.
         On macOS, uses AppleScript 'activate'. On other OSes, this is a no-op (returns False).
+        Pass resolved=True when app_name is already a display name from _resolve_application.
         """
         try:
             if self.system == "Darwin":
-                # Resolve to proper display name for AppleScript
-                resolved = self._resolve_application(app_name)
-                target_name = resolved[0] if resolved else app_name
+                target_name = app_name
+                if not resolved:
+                    # Resolve to proper display name for AppleScript
+                    match = self._resolve_application(app_name)
+                    target_name = match[0] if match else app_name
                 try:
-                    subprocess.run([
-                        "osascript", "-e", f'tell application "{target_name}" to activate'
-                    ], check=False)
+                    self._run_osa(f'tell application "{target_name}" to activate')
                     return True
                 except Exception:
                     return False
@@ -282,6 +782,106 @@ class AppLauncher:
         except Exception:
             return False
 
+    def _activate_if_running(self, display_name: str) -> bool:
+        """
+        Focus display_name if it is running, returning whether it was (macOS only).
+        The running check and the activate share one osascript call instead of two.
+        """
+        now = time.monotonic()
+        cached = self._running_cache.get(display_name)
+        if cached and now - cached[0] < _RUNNING_CACHE_TTL:
+            # Already checked moments ago; only the activate is left to do
+            return cached[1] and self.activate_application(display_name, resolved=True)
+        script = (
+            f'tell application "System Events" to set isRunning to (exists application process "{display_name}")\n'
+            f'if isRunning then tell application "{display_name}" to activate\n'
+            'return isRunning'
+        )
+        try:
+            out = self._run_osa(script).lower()
+        except Exception:
+            out = ''
+        if out not in ('true', 'false'):
+            # AppleScript unavailable or errored: fall back to the separate check + activate
+            return self._is_app_running(display_name) and self.activate_application(display_name, resolved=True)
+        running = out == 'true'
+        self._running_cache[display_name] = (now, running)
+        return running
+
+    def _run_osa(self, script: str, persistent: bool = True) -> str:
+        """
+        Run an AppleScript and return its stripped output.
+        Single-line scripts go through a long-lived `osascript -i` child, saving a process spawn
+        per call; multi-line scripts, persistent=False, or a misbehaving interpreter use a one-shot run.
+        """
+        if persistent and "\n" not in script and not AppLauncher._osa_disabled:
+            with AppLauncher._osa_lock:
+                out = self._osa_exchange(script)
+            if out is not None:
+                return out
+        res = subprocess.run([_OSA_BIN, "-e", script], capture_output=True, text=True)
+        return (res.stdout or '').strip()
+
+    @classmethod
+    def _osa_exchange(cls, script: str):
+        """
+        Send one line to the shared interpreter and return its result, or None if it failed.
+        A slow answer only shuts the interpreter down (the next call starts a fresh one); if it
+        can't run at all, one-shot calls are used from then on. Caller holds _osa_lock.
+        """
+        try:
+            if cls._osa is None or cls._osa.poll() is not None:
+                cls._osa = subprocess.Popen(
+                    [_OSA_BIN, "-i"],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    bufsize=0,
+                )
+            cls._osa.stdin.write(f"{script}\n{_OSA_SENTINEL}\n".encode())
+
+            # Raw reads on the fd so select() never misses output sitting in a Python-side buffer
+            fd = cls._osa.stdout.fileno()
+            buf = b''
+            deadline = time.monotonic() + _OSA_TIMEOUT
+            while _OSA_SENTINEL.encode() not in buf:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    raise TimeoutError("osascript did not answer")
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    raise EOFError("osascript exited")
+                buf += chunk
+
+            # Interactive mode reports results as "=> value" and errors as "!! message"
+            result = ''
+            for line in buf.decode(errors="replace").splitlines():
+                if _OSA_SENTINEL in line:
+                    break
+                if "=>" in line:
+                    result = line.split("=>", 1)[1].strip().strip('"')
+                elif "!!" in line:
+                    result = ''
+            return result
+        except TimeoutError as e:
+            print(f"Persistent osascript timed out, restarting it on next use: {e}")
+            cls._close_osa()
+            return None
+        except Exception as e:
+            print(f"Persistent osascript unavailable, using one-shot calls: {e}")
+            cls._osa_disabled = True
+            cls._close_osa()
+            return None
+
+    @classmethod
+    def _close_osa(cls):
+        """Terminate the shared osascript interpreter, if one is running."""
+        proc, cls._osa = cls._osa, None
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.close()
+                proc.terminate()
+            except Exception:
+                pass
+
     def running_apps_list_sentence(self):
         """
         Build a single sentence listing the currently running user applications.
@@ -290,22 +890,11 @@ class AppLauncher:
         Returns:
             str: e.g., "sir you currently have Google Chrome, Safari and Spotify open"
         """
-        apps = [a for a in self.speak_running_apps() if not self._is_system_process(a)]
+        # speak_running_apps already filters out system processes
+        apps = self.speak_running_apps()
         if not apps:
             return "sir, you currently have no applications open"
-        # De-duplicate while preserving order
-        seen = set()
-        unique_apps = []
-        for a in apps:
-            al = a.lower()
-            if al not in seen:
-                seen.add(al)
-                unique_apps.append(a)
-        if len(unique_apps) == 1:
-            apps_text = unique_apps[0]
-        else:
-            apps_text = ", ".join(unique_apps[:-1]) + f" and {unique_apps[-1]}"
-        return f"sir you currently have {apps_text} open"
+        return f"sir you currently have {_join_names(_unique_casefold(apps))} open"
 
     def check_app_running_message(self, app_phrase: str):
         """
@@ -347,23 +936,16 @@ class AppLauncher:
         """
         try:
             script = 'tell application "System Events" to get the name of every application process whose background only is false'
-            res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True)
-            output = (res.stdout or '').strip()
+            # One-shot: interactive mode prints lists as AppleScript literals, not the ", " text parsed below
+            output = self._run_osa(script, persistent=False)
             if not output:
                 return []
             # osascript joins list with ", ", sometimes newlines; split on commas
-            parts = [p.strip() for p in re.split(r",\s*|\n+", output) if p.strip()]
+            parts = [p.strip() for p in _OSA_LIST_SPLIT_RE.split(output) if p.strip()]
             # preserve order, de-dup
-            seen = set()
-            ordered = []
-            for p in parts:
-                pl = p.lower()
-                if pl not in seen:
-                    seen.add(pl)
-                    ordered.append(p)
+            ordered = _unique_casefold(parts)
             # Filter obvious non-user items just in case
-            banned = {"Dock", "WindowServer", "loginwindow"}
-            return [p for p in ordered if p not in banned]
+            return [p for p in ordered if p.casefold() not in _GUI_BANNED]
         except Exception as e:
             print(f"AppleScript running apps failed: {e}")
             return []
@@ -371,24 +953,34 @@ class AppLauncher:
     def speak_running_apps(self):
         """
         Get list of currently running applications (user-facing GUI apps preferred on macOS)
+        The list is reused for _RUNNING_APPS_TTL seconds, so a summary followed by a
+        "which apps?" question enumerates once.
 
         Returns:
             list: List of running application names
         """
+        now = time.monotonic()
+        cached = self._running_apps_cache
+        if cached and now - cached[0] < _RUNNING_APPS_TTL:
+            return list(cached[1])
+        apps = self._list_running_apps()
+        self._running_apps_cache = (now, tuple(apps))
+        return apps
+
+    def _list_running_apps(self):
+        """Uncached speak_running_apps."""
         try:
             if self.system == 'Darwin':
-                apps = self._get_running_apps_macos()
+                apps = [a for a in self._get_running_apps_macos() if not self._is_system_process(a)]
                 if apps:
                     return sorted(apps)
                 # Fall back to psutil if AppleScript returned nothing
+            seen = set()
             running_apps = []
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    app_name = proc.info['name']
-                    if app_name and app_name not in running_apps and not self._is_system_process(app_name):
-                        running_apps.append(app_name)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            for _, app_name, _ in self._iter_procs():
+                if app_name and app_name not in seen and not self._is_system_process(app_name):
+                    seen.add(app_name)
+                    running_apps.append(app_name)
 
             return sorted(running_apps)
 
@@ -407,53 +999,26 @@ class AppLauncher:
             dict: Summary with 'success', 'count', 'message' keys
         """
         try:
-            running_apps = self.speak_running_apps()
-
-            if not running_apps:
-                return {
-                    'success': True,
-                    'count': 0,
-                    'message': "No user applications are currently running, sir."
-                }
-
-            # Filter and limit results
-            user_apps = [app for app in running_apps if not self._is_system_process(app)]
-
-            if len(user_apps) == 0:
-                return {
-                    'success': True,
-                    'count': 0,
-                    'message': "No user applications are currently running, sir."
-                }
-            elif len(user_apps) == 1:
-                return {
-                    'success': True,
-                    'count': 1,
-                    'message': f"You have {user_apps[0]} running, sir."
-                }
-            elif len(user_apps) <= 3:
-                apps_text = ", ".join(user_apps[:-1]) + f" and {user_apps[-1]}"
-                return {
-                    'success': True,
-                    'count': len(user_apps),
-                    'message': f"You have {apps_text} running, sir."
-                }
-            elif len(user_apps) <= limit:
-                apps_text = ", ".join(user_apps[:-1]) + f" and {user_apps[-1]}"
-                return {
-                    'success': True,
-                    'count': len(user_apps),
-                    'message': f"Sir, you have {len(user_apps)} applications running: {apps_text}."
-                }
+            # Already filtered of system processes by speak_running_apps
+            user_apps = self.speak_running_apps()
+            n = len(user_apps)
+
+            if n == 0:
+                message = "No user applications are currently running, sir."
+            elif n <= 3:
+                message = f"You have {_join_names(user_apps)} running, sir."
+            elif n <= limit:
+                message = f"Sir, you have {n} applications running: {_join_names(user_apps)}."
             else:
-                top_apps = user_apps[:limit - 1]
-                apps_text = ", ".join(top_apps)
-                remaining = len(user_apps) - (limit - 1)
-                return {
-                    'success': True,
-                    'count': len(user_apps),
-                    'message': f"Sir, you have {len(user_apps)} applications running, including {apps_text}, and {remaining} others."
-                }
+                apps_text = ", ".join(user_apps[:limit - 1])
+                remaining = n - (limit - 1)
+                message = f"Sir, you have {n} applications running, including {apps_text}, and {remaining} others."
+
+            return {
+                'success': True,
+                'count': n,
+                'message': message
+            }
 
         except Exception as e:
             print(f"Error getting running apps summary: {e}")
@@ -468,138 +1033,135 @@ class AppLauncher:
         Heuristic check if an item is a system/background process rather than a user app.
         Note: On macOS, when using System Events to fetch GUI apps, this is rarely needed.
         """
-        system_processes = [
-            # macOS core/background
-            'kernel_task', 'launchd', 'WindowServer', 'Dock', 'loginwindow',
-            # Windows core
-            'svchost.exe', 'explorer.exe', 'winlogon.exe', 'csrss.exe',
-            # Linux core
-            'systemd', 'kthreadd', 'ksoftirqd',
-        ]
-        # Do NOT filter Finder or common GUI utilities; user expects to see them.
-        name_l = app_name.lower()
-        return any(sys_proc.lower() == name_l or sys_proc.lower() in name_l for sys_proc in system_processes)
+        return _is_system_process_name(app_name)
+
+
+# Shared launcher reused by every shortcut below (keeps the app scan cache warm)
+_LAUNCHER = AppLauncher()
+atexit.register(AppLauncher._close_osa)
+
+
+def _get_launcher():
+    """Return the shared AppLauncher used by the module-level helpers."""
+    return _LAUNCHER
+
+
+# Voice commands are I/O-bound (folder scan, osascript, open), so a cold app scan runs here
+# while the command is still being parsed
+_SCAN_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DeskPilotScan")
+atexit.register(_SCAN_POOL.shutdown, wait=False)
 
 
 # Pre-configured application shortcuts (silent operations):
 
 def open_chrome():
     """Open Google Chrome"""
-    launcher = AppLauncher()
-    return launcher.open_application("Google Chrome")
+    return _LAUNCHER.open_application("Google Chrome")
 
 
 def open_safari():
     """Open Safari"""
-    launcher = AppLauncher()
-    return launcher.open_application("Safari")
+    return _LAUNCHER.open_application("Safari")
 
 
 def open_firefox():
     """Open Firefox"""
-    launcher = AppLauncher()
-    return launcher.open_application("Firefox")
+    return _LAUNCHER.open_application("Firefox")
 
 
 def open_vscode():
     """Open Visual Studio Code"""
-    launcher = AppLauncher()
-    return launcher.open_application("Visual Studio Code")
+    return _LAUNCHER.open_application("Visual Studio Code")
 
 
 def open_spotify():
     """Open Spotify"""
-    launcher = AppLauncher()
-    return launcher.open_application("Spotify")
+    return _LAUNCHER.open_application("Spotify")
 
 
 def open_notes():
     """Open Notes app"""
-    launcher = AppLauncher()
-    return launcher.open_application("Notes")
+    return _LAUNCHER.open_application("Notes")
 
 
 def open_terminal():
     """Open Terminal"""
-    launcher = AppLauncher()
-    if platform.system() == "Darwin":
-        return launcher.open_application("Terminal")
-    elif platform.system() == "Windows":
-        return launcher.open_application("cmd")
+    if _PLATFORM == "Darwin":
+        return _LAUNCHER.open_application("Terminal")
+    elif _PLATFORM == "Windows":
+        return _LAUNCHER.open_application("cmd")
     else:
-        return launcher.open_application("gnome-terminal")
+        return _LAUNCHER.open_application("gnome-terminal")
 
 
 def open_calculator():
     """Open Calculator"""
-    launcher = AppLauncher()
-    return launcher.open_application("Calculator")
+    return _LAUNCHER.open_application("Calculator")
 
 
 def open_calendar():
     """Open Calendar application"""
-    launcher = AppLauncher()
-    return launcher.open_application("Calendar")
+    return _LAUNCHER.open_application("Calendar")
 
 
 # Quitting applications (silent operations)
 def quit_chrome():
     """Quit Google Chrome"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Google Chrome")
+    return _LAUNCHER.quit_application("Google Chrome")
 
 
 def quit_safari():
     """Quit Safari"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Safari")
+    return _LAUNCHER.quit_application("Safari")
 
 
 def quit_vscode():
     """Quit Visual Studio Code"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Visual Studio Code")
+    return _LAUNCHER.quit_application("Visual Studio Code")
 
 
 def quit_spotify():
     """Quit Spotify"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Spotify")
+    return _LAUNCHER.quit_application("Spotify")
 
 
 def quit_notes():
     """Quit Notes app"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Notes")
+    return _LAUNCHER.quit_application("Notes")
 
 
 def quit_terminal():
     """Quit Terminal"""
-    launcher = AppLauncher()
-    if platform.system() == "Darwin":
-        return launcher.quit_application("Terminal")
-    elif platform.system() == "Windows":
-        return launcher.quit_application("cmd")
+    if _PLATFORM == "Darwin":
+        return _LAUNCHER.quit_application("Terminal")
+    elif _PLATFORM == "Windows":
+        return _LAUNCHER.quit_application("cmd")
     else:
-        return launcher.quit_application("gnome-terminal")
+        return _LAUNCHER.quit_application("gnome-terminal")
 
 
 def quit_calculator():
     """Quit Calculator"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Calculator")
+    return _LAUNCHER.quit_application("Calculator")
 
 
 def quit_mail():
     """Quit Mail application"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Mail")
+    return _LAUNCHER.quit_application("Mail")
 
 
 def quit_calendar():
     """Quit Calendar application"""
-    launcher = AppLauncher()
-    return launcher.quit_application("Calendar")
+    return _LAUNCHER.quit_application("Calendar")
+
+
+def _words_after_trigger(words, triggers):
+    """Return the words following the first trigger word in one pass, or None."""
+    last = len(words) - 1
+    for i, w in enumerate(words):
+        if w in triggers and i < last:
+            return ' '.join(words[i + 1:])
+    return None
 
 
 # Enhanced voice command processing (silent operations - returns results for voice_handler to speak)
@@ -614,16 +1176,19 @@ def launch_app_by_voice(command, gpt_handler=None):
     Returns:
         dict: {'success': bool, 'app_name': str, 'message': str} for voice_handler to process
     """
-    launcher = AppLauncher()
+    launcher = _get_launcher()
+    # Warm the installed-apps scan in the background; it is only waited on right before resolving
+    scan_future = None
+    if _PLATFORM == 'Darwin' and time.time() - AppLauncher._apps_cache_time >= _APPS_CACHE_TTL:
+        scan_future = _SCAN_POOL.submit(launcher._scan_installed_apps)
     text = command.strip()
     lower = text.lower()
 
     # --- HARD-CODED GUARD FOR RUNNING-APPS STYLE QUERIES (prevents misrouting due to 'open'/'run' substrings) ---
     # If the phrase is actually asking about currently running apps, handle here and return early.
     try:
-        import re as _re
         # 1) Yes/No for a specific app being open/running
-        m = _re.search(r"^\s*is\s+(.+?)\s+(?:currently\s+)?(open|running)\??\s*$", lower)
+        m = _IS_RUNNING_RE.search(lower)
         if m:
             app_phrase = m.group(1).strip()
             check = launcher.check_app_running_message(app_phrase)
@@ -635,7 +1200,7 @@ def launch_app_by_voice(command, gpt_handler=None):
             }
 
         # 2) How many apps are open/running?
-        if ("how many" in lower) and ("app" in lower or "application" in lower or "applications" in lower or "apps" in lower) and ("open" in lower or "running" in lower or "currently open" in lower):
+        if _HOWMANY_RE.search(lower):
             summary = launcher.get_running_apps_summary()
             return {
                 'success': True,
@@ -645,12 +1210,7 @@ def launch_app_by_voice(command, gpt_handler=None):
             }
 
         # 3) Which/what apps are open/running? Or general running apps list/rundown
-        list_triggers = [
-            "which apps", "which applications", "what apps", "what applications",
-            "what's open", "what is open", "what's running", "what is running",
-            "show apps", "list apps", "running apps", "running applications", "currently running apps", "rundown"
-        ]
-        if any(t in lower for t in list_triggers):
+        if _LIST_TRIGGER_RE.search(lower):
             sentence = launcher.running_apps_list_sentence()
             return {
                 'success': True,
@@ -674,31 +1234,17 @@ def launch_app_by_voice(command, gpt_handler=None):
     # Basic extraction if GPT didn't provide
     if not app_phrase:
         # Remove common polite/filler phrases to better isolate the app name
-        fillers_pattern = r"\b(could you|would you|can you|please|be a dear and|go ahead and|would you mind|do me a favour and|do me a favor and|for me|for my deskpilot|deskpilot|the|my|a|an|app|application)\b"
-        cleaned = re.sub(fillers_pattern, " ", lower)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-
-        # Support multi-word triggers via regex
-        patterns = [
-            r"\b(open|launch|start|run)\s+(.+)$",
-            r"\b(bring up|pull up|fire up|boot up|pop open)\s+(.+)$",
-        ]
-        for pat in patterns:
-            m = re.search(pat, cleaned)
-            if m:
-                app_phrase = m.group(2).strip()
-                break
+        cleaned = _FILLERS_RE.sub(" ", lower)
+        cleaned = _WS_RE.sub(" ", cleaned).strip()
+
+        # Single pass over all open verbs, multi-word ones included
+        m = _OPEN_VERB_RE.search(cleaned)
+        if m:
+            app_phrase = m.group(2).strip()
 
         # Simple token fallback
         if not app_phrase:
-            triggers = ['open', 'launch', 'start', 'run']
-            words = cleaned.split()
-            for t in triggers:
-                if t in words:
-                    idx = words.index(t)
-                    if idx + 1 < len(words):
-                        app_phrase = ' '.join(words[idx + 1:])
-                        break
+            app_phrase = _words_after_trigger(cleaned.split(), _OPEN_TRIGGERS)
 
         # Last resort, use cleaned text
         if not app_phrase:
@@ -711,19 +1257,32 @@ def launch_app_by_voice(command, gpt_handler=None):
             'message': "I'm not sure which application you want to open, sir. Could you please be more specific?"
         }
 
-    # Resolve against installed apps dynamically
-    resolved = launcher._resolve_application(app_phrase)
+    if scan_future is not None:
+        try:
+            scan_future.result()
+        except Exception as e:
+            # _resolve_normalized below rescans on its own if this failed
+            print(f"Background app scan failed: {e}")
+
+    # Resolve against installed apps dynamically (once; the result is threaded through below)
+    resolved = launcher._resolve_normalized(launcher._normalize(app_phrase), app_phrase.lower())
     if resolved:
-        display_name, _path, _score = resolved
+        display_name, app_path, _score = resolved
         # If it's already running, focus instead of re-opening
-        if platform.system() == 'Darwin' and launcher._is_app_running(display_name):
-            launcher.activate_application(display_name)
+        if _PLATFORM == 'Darwin' and launcher._activate_if_running(display_name):
             return {
                 'success': True,
                 'app_name': display_name,
                 'message': f"Sir, {display_name} is already running, bringing it into focus now..."
             }
-        success = launcher.open_application(display_name)
+        try:
+            if _PLATFORM == 'Darwin':
+                success = launcher._open_resolved(display_name, app_path)
+            else:
+                success = launcher.open_application(display_name)
+        except Exception as e:
+            print(f"Error launching {display_name}: {e}")
+            success = False
         return {
             'success': success,
             'app_name': display_name,
@@ -731,7 +1290,7 @@ def launch_app_by_voice(command, gpt_handler=None):
         }
 
     # If not resolved on macOS, avoid misleading attempts
-    if platform.system() == 'Darwin':
+    if _PLATFORM == 'Darwin':
         return {
             'success': False,
             'app_name': app_phrase,
@@ -758,7 +1317,7 @@ def quit_app_by_voice(command, gpt_handler=None):
     Returns:
         dict: {'success': bool, 'app_name': str, 'message': str} for voice_handler to process
     """
-    launcher = AppLauncher()
+    launcher = _get_launcher()
     text = command.strip()
     lower = text.lower()
 
@@ -775,31 +1334,17 @@ def quit_app_by_voice(command, gpt_handler=None):
     # Basic extraction if GPT didn't provide
     if not app_phrase:
         # Remove common polite/filler phrases to better isolate the app name
-        fillers_pattern = r"\b(could you|would you|can you|please|be a dear and|go ahead and|would you mind|do me a favour and|do me a favor and|for me|for my deskpilot|deskpilot|the|my|a|an|app|application)\b"
-        cleaned = re.sub(fillers_pattern, " ", lower)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-
-        # Support multi-word triggers via regex
-        patterns = [
-            r"\b(quit|close|stop|exit|kill)\s+(.+)$",
-            r"\b(shut down|close out|end|terminate|dismiss)\s+(.+)$",
-        ]
-        for pat in patterns:
-            m = re.search(pat, cleaned)
-            if m:
-                app_phrase = m.group(2).strip()
-                break
+        cleaned = _FILLERS_RE.sub(" ", lower)
+        cleaned = _WS_RE.sub(" ", cleaned).strip()
+
+        # Single pass over all quit verbs, multi-word ones included
+        m = _QUIT_VERB_RE.search(cleaned)
+        if m:
+            app_phrase = m.group(2).strip()
 
         # Simple token fallback
         if not app_phrase:
-            triggers = ['quit', 'close', 'stop', 'exit', 'kill']
-            words = cleaned.split()
-            for t in triggers:
-                if t in words:
-                    idx = words.index(t)
-                    if idx + 1 < len(words):
-                        app_phrase = ' '.join(words[idx + 1:])
-                        break
+            app_phrase = _words_after_trigger(cleaned.split(), _QUIT_TRIGGERS)
 
         # Last resort, use cleaned text
         if not app_phrase:
@@ -812,11 +1357,11 @@ def quit_app_by_voice(command, gpt_handler=None):
             'message': "I'm not sure which application you want to quit, sir. Could you please specify?"
         }
 
-    resolved = launcher._resolve_application(app_phrase)
+    resolved = launcher._resolve_normalized(launcher._normalize(app_phrase), app_phrase.lower())
     target_name = resolved[0] if resolved else app_phrase
 
     # If it's not running, report that cleanly (macOS dynamic behavior already mirrors current style)
-    if platform.system() == 'Darwin' and not launcher._is_app_running(target_name):
+    if _PLATFORM == 'Darwin' and not launcher._is_app_running(target_name):
         return {
             'success': False,
             'app_name': target_name,
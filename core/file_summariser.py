@@ -1,169 +1,494 @@
 # Logic to parse & summarise files
 import os
-import sys
+import functools
+import mmap
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-import PyPDF2
-import docx
-import pandas as pd
-
-# Add parent directory for imports
-sys.path.append(str(Path(__file__).parent.parent))
 
 from config import SUPPORTED_FILE_TYPES, DEFAULT_SUMMARY_LENGTH
-# GPT integration (optional)
-try:
-    from gpt import GPTHandler
-except Exception:
-    GPTHandler = None
+
+# O(1) extension checks; SUPPORTED_FILE_TYPES keeps its order for the error message
+_SUPPORTED_SUFFIXES = frozenset(t.lower() for t in SUPPORTED_FILE_TYPES)
+
+@functools.lru_cache(maxsize=1)
+def _get_gpt():
+    """
+    Shared GPTHandler, created on first summary; None if GPT isn't available (optional integration).
+    Imported here rather than at module level so extraction worker processes never load gpt.
+    """
+    try:
+        from gpt import get_gpt_handler
+    except Exception:
+        return None
+    return get_gpt_handler()
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_backend():
+    """
+    Pick the PDF text extractor once, on first use (imports are heavy).
+    pypdfium2 wraps the C++ PDFium engine and is far faster per page; pypdf, the maintained
+    successor of PyPDF2, is the pure-Python fallback. Returns (name, module) or (None, None).
+    """
+    try:
+        import pypdfium2
+        return 'pdfium', pypdfium2
+    except ImportError:
+        pass
+    try:
+        import pypdf
+        return 'pypdf', pypdf
+    except ImportError:
+        pass
+    try:
+        import PyPDF2
+        return 'pypdf', PyPDF2
+    except ImportError:
+        return None, None
+
+
+def _file_suffix(file_path: str) -> str:
+    """Lowercased extension without building a Path object."""
+    return os.path.splitext(file_path)[1].lower()
+
+
+def _extract_worker(file_path: str, max_chars: Optional[int] = None):
+    """
+    Process-pool entry point for FileSummariser.add_files (module level so it pickles).
+    Returns (path, mtime_ns, size, text); text is None if extraction failed or stopped
+    early because the file is longer than max_chars.
+    """
+    stat = os.stat(file_path)
+    text = FileSummariser().extract_text_content(file_path, stat, max_chars=max_chars)
+    return file_path, stat.st_mtime_ns, stat.st_size, text
+
+
+# pypdf fallback: pages whose content stream is larger than this and almost free of text-showing
+# operators (plots, vector figures) are skipped rather than interpreted operator by operator
+_MAX_PAGE_STREAM_BYTES = 2 * 1024 * 1024
+_MIN_TEXT_OPS_PER_MB = 50
+
+
+def _is_graphics_heavy(page) -> bool:
+    """Cheap byte-level check of a pypdf page's content stream; True means skip its text extraction."""
+    try:
+        contents = page.get_contents()
+        if contents is None:
+            return False
+        data = contents.get_data()
+    except Exception:
+        return False
+    if len(data) <= _MAX_PAGE_STREAM_BYTES:
+        return False
+    text_ops = data.count(b"Tj") + data.count(b"TJ")
+    return text_ops < _MIN_TEXT_OPS_PER_MB * len(data) / (1024 * 1024)
+
+
+# Request kinds in priority order, each keyword list compiled into one alternation.
+# Plain substrings, as before: "highlights" hits "highlight", "classes" hits "class".
+_KIND_PATTERNS = tuple(
+    (kind, re.compile("|".join(map(re.escape, keywords))))
+    for kind, keywords in (
+        ('timeline', ("timeline", "chronology", "chronological", "sequence of events")),
+        ('highlights', ("highlight", "key points", "keypoints", "keywords", "names", "dates", "figures", "topics")),
+        ('code', ("code", "function", "class", "method", "variable", "algorithm")),
+    )
+)
+
+# File size limits (configured in GB, computed to bytes)
+_MIN_FILE_SIZE_GB = 0.000001  # ~1 KB
+_MAX_FILE_SIZE_GB = 0.05      # ~50 MB
+_MIN_FILE_SIZE = int(_MIN_FILE_SIZE_GB * (1024 ** 3))
+_MAX_FILE_SIZE = int(_MAX_FILE_SIZE_GB * (1024 ** 3))
+
+# Content length limits (in characters)
+_MIN_CONTENT_LENGTH = 100  # Minimum 100 characters
+_MAX_CONTENT_LENGTH = 1000000  # Maximum ~1M characters
+
+# Validation messages depend only on the limits above, so build them once
+_ERR_UNSUPPORTED = f"Unsupported file type. Supported types: {', '.join(SUPPORTED_FILE_TYPES)}"
+_ERR_TOO_SMALL = (
+    f"File is too small. Minimum size: {_MIN_FILE_SIZE_GB:.9f} GB "
+    f"(~{_MIN_FILE_SIZE/1024:.1f} KB)"
+)
+_ERR_TOO_LARGE = (
+    f"File is too large. Maximum size: {_MAX_FILE_SIZE_GB:.3f} GB "
+    f"(~{_MAX_FILE_SIZE/(1024*1024):.1f} MB)"
+)
+_ERR_TOO_SHORT = f"File content is too short. Minimum content: {_MIN_CONTENT_LENGTH} characters"
+_ERR_TOO_LONG = f"File content is too long. Maximum content: {_MAX_CONTENT_LENGTH / 1000:.0f}K characters"
+
+# Longest UTF-8 encoding of one character
+_MAX_UTF8_BYTES = 4
+
+# How far into each end of a text _stripped_length looks for surrounding whitespace
+_STRIP_PEEK = 1024
+
+
+def _stripped_length(text: str) -> int:
+    """len(text.strip()), examining only the ends unless the whitespace runs are unusually long."""
+    head = text[:_STRIP_PEEK]
+    tail = text[-_STRIP_PEEK:]
+    lead = len(head) - len(head.lstrip())
+    trail = len(tail) - len(tail.rstrip())
+    if lead == len(head) or trail == len(tail):
+        # Whitespace reaches past a peek window (or the text is blank): measure it properly
+        return len(text.strip())
+    return len(text) - lead - trail
+
+
+def _normalise_newlines(text: str) -> str:
+    """Match text-mode reading, which translated Windows/old-Mac line endings"""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+class _ContentTooLong(Exception):
+    """An extractor stopped early: the text is known to exceed max_chars, so what it read is partial."""
+
+
+def _past_limit(parts: List[str], total: int, max_chars: Optional[int]) -> bool:
+    """
+    True once parts, joined with newlines and stripped, are longer than max_chars.
+    total is sum(len(part) + 1); the exact check only runs once that rough count is over.
+    """
+    return (max_chars is not None and total - 1 > max_chars
+            and _stripped_length("\n".join(parts)) > max_chars)
+
+
+# Per-kind instructions appended to the summary prompt
+_KIND_EXTRA = {
+    'timeline': "Create a clear chronological timeline of events as bullet points with timestamps/dates if present.",
+    'highlights': (
+        "Extract highlights: top keywords, named people/organizations, dates, figures, and most discussed topics. "
+        "Return as concise sections with short bullet points."
+    ),
+    'code': (
+        "Summarise code: describe the overall purpose, list key functions/classes and explain what important lines/blocks do. "
+        "Point out any potential issues or noteworthy patterns."
+    ),
+    'general': "Provide a short, helpful summary.",
+}
+
+# Offline highlights: candidate keywords, and how much text to count them over
+_WORD_RE = re.compile(r"[A-Za-z]{4,}")
+_KEYWORD_SCAN_CHARS = 200_000
+
+# Rows per pandas chunk when reading CSVs
+_CSV_CHUNK_ROWS = 50_000
+
+
+def _merge_column_stats(stats: Dict, col, values):
+    """Fold one chunk's values into running count/mean/M2/min/max (Chan et al. parallel update)."""
+    n_b = len(values)
+    mean_b = float(values.mean())
+    m2_b = float(((values - mean_b) ** 2).sum())
+    min_b, max_b = float(values.min()), float(values.max())
+    if col not in stats:
+        stats[col] = [n_b, mean_b, m2_b, min_b, max_b]
+        return
+    n_a, mean_a, m2_a, min_a, max_a = stats[col]
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    stats[col] = [
+        n,
+        mean_a + delta * n_b / n,
+        m2_a + m2_b + delta * delta * n_a * n_b / n,
+        min(min_a, min_b),
+        max(max_a, max_b),
+    ]
+
+
+def _format_column_stats(pd, stats: Dict, columns) -> str:
+    """Render merged chunk statistics like DataFrame.describe() (without quantiles)."""
+    table = {}
+    for col in columns:
+        n, mean, m2, col_min, col_max = stats.get(col, [0, float('nan'), 0.0, float('nan'), float('nan')])
+        std = (m2 / (n - 1)) ** 0.5 if n > 1 else float('nan')
+        table[col] = [float(n), mean, std, col_min, col_max]
+    return pd.DataFrame(table, index=['count', 'mean', 'std', 'min', 'max']).to_string()
 
 
 class FileSummariser:
+    # Limits shared by every instance (kept as attributes for existing callers)
+    MIN_FILE_SIZE_GB = _MIN_FILE_SIZE_GB
+    MAX_FILE_SIZE_GB = _MAX_FILE_SIZE_GB
+    MIN_FILE_SIZE = _MIN_FILE_SIZE
+    MAX_FILE_SIZE = _MAX_FILE_SIZE
+    MIN_CONTENT_LENGTH = _MIN_CONTENT_LENGTH
+    MAX_CONTENT_LENGTH = _MAX_CONTENT_LENGTH
+
     def __init__(self):
         self.uploaded_files = []
+        # Same paths as uploaded_files, for O(1) membership checks (the list keeps upload order)
+        self._uploaded_set = set()
         self.processed_files = {}
+        # path -> (mtime_ns, size, text): validate/info/summarise all reuse one extraction
+        self._content_cache: Dict[str, Tuple[int, int, str]] = {}
 
-        # File size limits (configured in GB, computed to bytes)
-        self.MIN_FILE_SIZE_GB = 0.000001  # ~1 KB
-        self.MAX_FILE_SIZE_GB = 0.05      # ~50 MB
-        self.MIN_FILE_SIZE = int(self.MIN_FILE_SIZE_GB * (1024 ** 3))
-        self.MAX_FILE_SIZE = int(self.MAX_FILE_SIZE_GB * (1024 ** 3))
-
-        # Content length limits (in characters)
-        self.MIN_CONTENT_LENGTH = 100  # Minimum 100 characters
-        self.MAX_CONTENT_LENGTH = 1000000  # Maximum ~1M characters
+    def _stat(self, file_path: str) -> os.stat_result:
+        """Single stat call whose result is shared by existence, size and cache checks."""
+        return os.stat(file_path)
 
-    def validate_file(self, file_path: str) -> Tuple[bool, str]:
+    def validate_file(self, file_path: str, stat: Optional[os.stat_result] = None) -> Tuple[bool, str]:
         """
         Validate if the file meets our criteria
+        Pass stat if the caller already has the file's stat result.
         Returns: (is_valid, error_message)
         """
         try:
-            file_path_obj = Path(file_path)
-
-            # Check if file exists
-            if not file_path_obj.exists():
-                return False, "File does not exist."
+            # Check if file exists (the stat below doubles as the existence check)
+            if stat is None:
+                try:
+                    stat = self._stat(file_path)
+                except FileNotFoundError:
+                    return False, "File does not exist."
 
             # Check file extension
-            if file_path_obj.suffix.lower() not in SUPPORTED_FILE_TYPES:
-                return False, f"Unsupported file type. Supported types: {', '.join(SUPPORTED_FILE_TYPES)}"
+            if _file_suffix(file_path) not in _SUPPORTED_SUFFIXES:
+                return False, _ERR_UNSUPPORTED
 
             # Check file size
-            file_size = file_path_obj.stat().st_size
+            file_size = stat.st_size
             if file_size < self.MIN_FILE_SIZE:
-                return False, (
-                    f"File is too small. Minimum size: {self.MIN_FILE_SIZE_GB:.9f} GB "
-                    f"(~{self.MIN_FILE_SIZE/1024:.1f} KB)"
-                )
+                return False, _ERR_TOO_SMALL
 
             if file_size > self.MAX_FILE_SIZE:
-                return False, (
-                    f"File is too large. Maximum size: {self.MAX_FILE_SIZE_GB:.3f} GB "
-                    f"(~{self.MAX_FILE_SIZE/(1024*1024):.1f} MB)"
-                )
+                return False, _ERR_TOO_LARGE
 
-            # Try to read and validate content
-            content = self.extract_text_content(file_path)
+            # Try to read and validate content; stop parsing once it's already too long to accept
+            try:
+                content = self._extract_content(file_path, stat, max_chars=self.MAX_CONTENT_LENGTH)
+            except _ContentTooLong:
+                return False, _ERR_TOO_LONG
+            except Exception as e:
+                print(f"Error extracting text from {file_path}: {str(e)}")
+                content = None
             if not content:
                 return False, "Could not extract text content from file."
 
-            content_length = len(content.strip())
+            # Only the ends are inspected; strip() would copy up to ~1M characters just to count
+            content_length = _stripped_length(content)
             if content_length < self.MIN_CONTENT_LENGTH:
-                return False, f"File content is too short. Minimum content: {self.MIN_CONTENT_LENGTH} characters"
+                return False, _ERR_TOO_SHORT
 
             if content_length > self.MAX_CONTENT_LENGTH:
-                return False, f"File content is too long. Maximum content: {self.MAX_CONTENT_LENGTH / 1000:.0f}K characters"
+                return False, _ERR_TOO_LONG
 
             return True, "File is valid."
 
         except Exception as e:
             return False, f"Error validating file: {str(e)}"
 
-    def extract_text_content(self, file_path: str) -> Optional[str]:
+    def extract_text_content(self, file_path: str, stat: Optional[os.stat_result] = None,
+                             max_chars: Optional[int] = None) -> Optional[str]:
         """
         Extract text content from supported file types
+        With max_chars, extraction may stop early once the text is known to be longer than that;
+        None is returned then, since the partial text isn't the file's content.
         Returns the extracted text or None if extraction fails
         """
         try:
-            file_path_obj = Path(file_path)
-            file_extension = file_path_obj.suffix.lower()
-
-            if file_extension == '.pdf':
-                return self._extract_pdf_text(file_path)
-            elif file_extension == '.docx':
-                return self._extract_docx_text(file_path)
-            elif file_extension == '.csv':
-                return self._extract_csv_text(file_path)
-            elif file_extension == '.txt':
-                return self._extract_txt_text(file_path)
-            else:
-                return None
-
+            return self._extract_content(file_path, stat, max_chars)
+        except _ContentTooLong:
+            return None
         except Exception as e:
             print(f"Error extracting text from {file_path}: {str(e)}")
             return None
 
-    def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text from PDF file"""
-        text = ""
+    def _extract_content(self, file_path: str, stat: Optional[os.stat_result] = None,
+                         max_chars: Optional[int] = None) -> Optional[str]:
+        """
+        extract_text_content without the error handling: raises _ContentTooLong when an
+        extractor stopped early, so only complete text is ever returned or cached.
+        """
+        file_extension = _file_suffix(file_path)
+
+        # Reuse the last extraction while the file is unchanged on disk
+        if stat is None:
+            stat = self._stat(file_path)
+        cached = self._content_cache.get(file_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        if file_extension == '.pdf':
+            text = self._extract_pdf_text(file_path, max_chars)
+        elif file_extension == '.docx':
+            text = self._extract_docx_text(file_path, max_chars)
+        elif file_extension == '.csv':
+            text = self._extract_csv_text(file_path)
+        elif file_extension == '.txt':
+            text = self._extract_txt_text(file_path, max_chars)
+        else:
+            return None
+
+        if text is not None:
+            self._content_cache[file_path] = (stat.st_mtime_ns, stat.st_size, text)
+        return text
+
+    def _extract_pdf_text(self, file_path: str, max_chars: Optional[int] = None) -> str:
+        """
+        Extract text from PDF file
+        With max_chars, raises _ContentTooLong after the first page that takes the stripped text
+        past that many characters.
+        """
+        backend, pdf_lib = _pdf_backend()
+        if backend is None:
+            raise Exception("Error reading PDF: no PDF library installed (pypdfium2 or pypdf)")
+        if backend == 'pdfium':
+            return self._extract_pdf_text_pdfium(pdf_lib, file_path, max_chars)
+        # Collect pages and join once; `text += page` re-copies the whole string every page,
+        # which goes quadratic on long PDFs (pdfminer.six fixed the same pattern the same way)
+        parts = []
+        total = 0
         try:
             with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                pdf_reader = pdf_lib.PdfReader(file)
+                for number, page in enumerate(pdf_reader.pages, start=1):
+                    if _is_graphics_heavy(page):
+                        print(f"Skipping graphics-heavy page {number} of {os.path.basename(file_path)}")
+                        continue
+                    page_text = page.extract_text() or ""
+                    parts.append(page_text)
+                    total += len(page_text) + 1
+                    if _past_limit(parts, total, max_chars):
+                        raise _ContentTooLong()
+        except _ContentTooLong:
+            raise
+        except Exception as e:
+            raise Exception(f"Error reading PDF: {str(e)}")
+        return "\n".join(parts).strip()
+
+    def _extract_pdf_text_pdfium(self, pdfium, file_path: str, max_chars: Optional[int] = None) -> str:
+        """
+        Extract text from PDF file with pypdfium2
+        The textpage only walks text objects, so figure-heavy pages cost little here.
+        """
+        try:
+            parts = []
+            total = 0
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    parts.append(page_text)
+                    total += len(page_text) + 1
+                    if _past_limit(parts, total, max_chars):
+                        raise _ContentTooLong()
+            finally:
+                pdf.close()
+            return "\n".join(parts).strip()
+        except _ContentTooLong:
+            raise
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
-        return text.strip()
 
-    def _extract_docx_text(self, file_path: str) -> str:
-        """Extract text from DOCX file"""
+    def _extract_docx_text(self, file_path: str, max_chars: Optional[int] = None) -> str:
+        """
+        Extract text from DOCX file
+        With max_chars, raises _ContentTooLong as soon as the stripped text is past that length.
+        """
+        import docx  # heavy; only loaded when a DOCX is actually read
         try:
             doc = docx.Document(file_path)
             text = []
+            total = 0
             for paragraph in doc.paragraphs:
                 text.append(paragraph.text)
+                total += len(paragraph.text) + 1
+                if _past_limit(text, total, max_chars):
+                    raise _ContentTooLong()
             return "\n".join(text).strip()
+        except _ContentTooLong:
+            raise
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
 
     def _extract_csv_text(self, file_path: str) -> str:
-        """Extract text representation from CSV file"""
+        """
+        Extract text representation from CSV file
+        Reads in chunks so a large CSV never sits in memory as one DataFrame; numeric statistics
+        are merged across chunks (exact describe() when the file fits in a single chunk).
+        """
+        import pandas as pd  # pandas adds hundreds of ms at import; defer until a CSV is read
         try:
-            # Read CSV and convert to string representation
-            df = pd.read_csv(file_path)
+            rows = 0
+            head = None
+            single_chunk = None
+            numeric_cols = []
+            # column -> [count, mean, sum of squared deviations, min, max]
+            stats = {}
+            for chunk in pd.read_csv(file_path, chunksize=_CSV_CHUNK_ROWS):
+                if head is None:
+                    head = chunk.head(10)
+                    numeric_cols = chunk.select_dtypes(include=['number']).columns.tolist()
+                    single_chunk = chunk
+                else:
+                    single_chunk = None
+                rows += len(chunk)
+                for col in numeric_cols:
+                    values = pd.to_numeric(chunk[col], errors='coerce').dropna()
+                    if values.empty:
+                        continue
+                    _merge_column_stats(stats, col, values)
+            if head is None:
+                # Header-only file: no chunks, but the columns are still worth reporting
+                head = pd.read_csv(file_path, nrows=0)
 
             # Create a text representation
-            text = f"CSV File with {len(df)} rows and {len(df.columns)} columns.\n\n"
-            text += f"Columns: {', '.join(df.columns.tolist())}\n\n"
+            text = f"CSV File with {rows} rows and {len(head.columns)} columns.\n\n"
+            text += f"Columns: {', '.join(map(str, head.columns.tolist()))}\n\n"
 
             # Add first few rows as sample
-            sample_size = min(10, len(df))
+            sample_size = min(10, len(head))
             text += f"Sample data (first {sample_size} rows):\n"
-            text += df.head(sample_size).to_string()
+            text += head.head(sample_size).to_string()
 
             # Add basic statistics if numeric columns exist
-            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
             if numeric_cols:
                 text += f"\n\nBasic statistics for numeric columns:\n"
-                text += df[numeric_cols].describe().to_string()
+                if single_chunk is not None:
+                    text += single_chunk[numeric_cols].describe().to_string()
+                else:
+                    text += _format_column_stats(pd, stats, numeric_cols)
 
             return text
         except Exception as e:
             raise Exception(f"Error reading CSV: {str(e)}")
 
-    def _extract_txt_text(self, file_path: str) -> str:
-        """Extract text from TXT file"""
+    def _extract_txt_text(self, file_path: str, max_chars: Optional[int] = None) -> str:
+        """
+        Extract text from TXT file
+        With max_chars, raises _ContentTooLong when a decoded prefix already shows the file is too long.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read().strip()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    return file.read().strip()
-            except Exception as e:
-                raise Exception(f"Error reading TXT file: {str(e)}")
+            with open(file_path, 'rb') as file:
+                size = os.fstat(file.fileno()).st_size
+                if size == 0:
+                    return ""  # mmap can't map an empty file
+                # Decode straight out of the mapping; no intermediate bytes copy of the file
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if max_chars is not None and size > _MAX_UTF8_BYTES * (max_chars + 1):
+                        # More bytes than max_chars characters could ever take: decoding a prefix
+                        # is normally enough to show the file is over the limit
+                        prefix = _normalise_newlines(str(mapped[:_MAX_UTF8_BYTES * (max_chars + 1)], 'utf-8', 'ignore'))
+                        if _stripped_length(prefix) > max_chars:
+                            raise _ContentTooLong()
+                    try:
+                        text = str(mapped, 'utf-8')
+                    except UnicodeDecodeError:
+                        # Try with different encoding
+                        text = str(mapped, 'latin-1')
+            return _normalise_newlines(text).strip()
+        except _ContentTooLong:
+            raise
         except Exception as e:
             raise Exception(f"Error reading TXT file: {str(e)}")
 
@@ -178,20 +503,55 @@ class FileSummariser:
             return False, message
 
         # Check if already added
-        if file_path in self.uploaded_files:
+        if file_path in self._uploaded_set:
             return False, "File is already in the upload list."
 
         # Add to list
         self.uploaded_files.append(file_path)
-        return True, f"File '{Path(file_path).name}' added successfully."
+        self._uploaded_set.add(file_path)
+        return True, f"File '{os.path.basename(file_path)}' added successfully."
+
+    def add_files(self, file_paths: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Add several files, extracting their content in parallel worker processes first
+        (PDF/DOCX/CSV parsing is CPU-bound, so threads wouldn't help).
+        Returns one (success, message) per path, in order.
+        """
+        # Only parse files that could pass validation; add_file reports the rest as usual
+        to_extract = []
+        for file_path in dict.fromkeys(file_paths):
+            try:
+                size = self._stat(file_path).st_size
+            except OSError:
+                continue
+            if (_file_suffix(file_path) in _SUPPORTED_SUFFIXES
+                    and self.MIN_FILE_SIZE <= size <= self.MAX_FILE_SIZE):
+                to_extract.append(file_path)
+
+        if len(to_extract) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(len(to_extract), os.cpu_count() or 1)) as pool:
+                    # Same early stop as validation, so files it would reject aren't parsed in full
+                    limits = [self.MAX_CONTENT_LENGTH] * len(to_extract)
+                    for path, mtime_ns, size, text in pool.map(_extract_worker, to_extract, limits):
+                        if text is not None:
+                            self._content_cache[path] = (mtime_ns, size, text)
+            except Exception as e:
+                # Fall back to extracting one by one inside add_file
+                print(f"Parallel extraction failed: {e}")
+
+        # Validation now finds each file's content in the cache
+        return [self.add_file(file_path) for file_path in file_paths]
 
     def remove_file(self, file_path: str) -> bool:
         """Remove file from upload list"""
-        if file_path in self.uploaded_files:
+        if file_path in self._uploaded_set:
+            self._uploaded_set.discard(file_path)
             self.uploaded_files.remove(file_path)
             # Also remove from processed files if it exists
             if file_path in self.processed_files:
                 del self.processed_files[file_path]
+            self._content_cache.pop(file_path, None)
             return True
         return False
 
@@ -202,16 +562,20 @@ class FileSummariser:
     def clear_all_files(self):
         """Clear all uploaded and processed files"""
         self.uploaded_files.clear()
+        self._uploaded_set.clear()
         self.processed_files.clear()
+        self._content_cache.clear()
 
     def get_file_info(self, file_path: str) -> Dict:
         """Get information about a file"""
+        file_path_obj = Path(file_path)
         try:
-            file_path_obj = Path(file_path)
-            file_size = file_path_obj.stat().st_size
+            stat = self._stat(file_path)
+            file_size = stat.st_size
 
-            # Get content length
-            content = self.extract_text_content(file_path)
+            # Validate first; it extracts the content, which the lookup below then takes from the cache
+            is_valid = self.validate_file(file_path, stat)[0]
+            content = self.extract_text_content(file_path, stat)
             content_length = len(content) if content else 0
 
             return {
@@ -221,11 +585,11 @@ class FileSummariser:
                 'size_readable': self._format_file_size(file_size),
                 'extension': file_path_obj.suffix.lower(),
                 'content_length': content_length,
-                'is_valid': self.validate_file(file_path)[0]
+                'is_valid': is_valid
             }
         except Exception as e:
             return {
-                'name': Path(file_path).name,
+                'name': file_path_obj.name,
                 'path': file_path,
                 'error': str(e),
                 'is_valid': False
@@ -241,9 +605,10 @@ class FileSummariser:
             return f"{size_bytes / (1024 * 1024):.1f} MB"
 
     # ---------------- Summarization helpers (GPT-backed with fallbacks) ----------------
-    def summarise(self, file_path: str, instruction: str = "Provide a general summary") -> Dict:
+    def summarise(self, file_path: str, instruction: str = "Provide a general summary", text: Optional[str] = None) -> Dict:
         """
         Summarise a single file according to instruction.
+        Pass text if the caller already extracted the file's content.
         Returns dict: { success, message, summary, kind }
         """
         try:
@@ -252,21 +617,22 @@ class FileSummariser:
             if not ok:
                 return { 'success': False, 'message': emsg, 'summary': '', 'kind': 'error' }
 
-            text = self.extract_text_content(file_path) or ''
+            if text is None:
+                text = self.extract_text_content(file_path) or ''
             if not text.strip():
                 return { 'success': False, 'message': 'No textual content could be extracted from the file.', 'summary': '', 'kind': 'error' }
 
             kind = self._detect_request_kind(instruction)
-            prompt = self._build_prompt(kind, instruction, Path(file_path).name)
+            filename = os.path.basename(file_path)
+            prompt = self._build_prompt(kind, instruction, filename)
 
             # Use GPT if available with a dedicated summariser; else fallback to heuristic short summary
             summary = None
-            if GPTHandler:
+            gpt = _get_gpt()
+            if gpt:
                 try:
-                    gpt = GPTHandler()
-                    # Larger context slice to help GPT, but keep a cap for tokens
-                    content_slice = text[:20000]
-                    summary = gpt.summarize(content_slice, instruction, kind, Path(file_path).name, max_tokens=900, temperature=0.5)
+                    # Whole text: long files are chunked and map-reduced inside the handler
+                    summary = gpt.summarize_long(text, instruction, kind, filename, max_tokens=900, temperature=0.5)
                     # Robust failure filtering: treat apologies/errors as failure
                     if summary and isinstance(summary, str):
                         s_low = summary.lower()
@@ -293,12 +659,9 @@ class FileSummariser:
 
     def _detect_request_kind(self, instruction: str) -> str:
         s = (instruction or '').lower()
-        if any(k in s for k in ["timeline", "chronology", "chronological", "sequence of events"]):
-            return 'timeline'
-        if any(k in s for k in ["highlight", "key points", "keypoints", "keywords", "names", "dates", "figures", "topics"]):
-            return 'highlights'
-        if any(k in s for k in ["code", "function", "class", "method", "variable", "algorithm"]):
-            return 'code'
+        for kind, pattern in _KIND_PATTERNS:
+            if pattern.search(s):
+                return kind
         return 'general'
 
     def _build_prompt(self, kind: str, instruction: str, filename: str) -> str:
@@ -306,20 +669,7 @@ class FileSummariser:
             "You are DeskPilot, an assistant that summarises files for the user (address them as 'sir').\n"
             f"File: {filename}. Keep it concise and structured."
         )
-        if kind == 'timeline':
-            extra = "Create a clear chronological timeline of events as bullet points with timestamps/dates if present."
-        elif kind == 'highlights':
-            extra = (
-                "Extract highlights: top keywords, named people/organizations, dates, figures, and most discussed topics. "
-                "Return as concise sections with short bullet points."
-            )
-        elif kind == 'code':
-            extra = (
-                "Summarise code: describe the overall purpose, list key functions/classes and explain what important lines/blocks do. "
-                "Point out any potential issues or noteworthy patterns."
-            )
-        else:
-            extra = "Provide a short, helpful summary."
+        extra = _KIND_EXTRA.get(kind, _KIND_EXTRA['general'])
         if instruction and instruction.strip():
             extra += f"\nThe user additionally requested: {instruction.strip()}"
         return base + "\n\n" + extra
@@ -331,10 +681,9 @@ class FileSummariser:
         if kind == 'timeline':
             return "Timeline (approximate):\n- " + "\n- ".join(head[:8])
         if kind == 'highlights':
-            # Simulate highlights by common words
-            import re, collections
-            words = re.findall(r"[A-Za-z]{4,}", text.lower())
-            common = [w for w, _ in collections.Counter(words).most_common(8)]
+            # Simulate highlights by common words; lowercase each match rather than copying the whole text
+            counts = Counter(m.group(0).lower() for m in _WORD_RE.finditer(text, 0, _KEYWORD_SCAN_CHARS))
+            common = [w for w, _ in counts.most_common(8)]
             return (
                 "Highlights:\n- Keywords: " + ", ".join(common) +
                 "\n- Top lines:\n- " + "\n- ".join(head[:5])
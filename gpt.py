@@ -1,31 +1,293 @@
 # Logic for handling GPT integration
 import sys
-import random
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
 from pathlib import Path
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent))
+# Add project root to path (once, even if this module is imported again)
+_ROOT = str(Path(__file__).resolve().parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from config import ASSISTANT_NAME, USER_NAME, MAX_TOKENS, TEMPERATURE, openai_client, OPENAI_AVAILABLE
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    from openai import AsyncOpenAI
+    ASYNC_OPENAI_AVAILABLE = True
+except ImportError:
+    ASYNC_OPENAI_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Near-deterministic replies (name/identity) are reused for an hour, most recent 128 kept
+_RESPONSE_CACHE_TTL = 3600
+_RESPONSE_CACHE_SIZE = 128
+
+# Paraphrased questions ("what can you do?" / "what are you able to do?") reuse a reply above this cosine similarity
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_SEMANTIC_THRESHOLD = 0.92
+_SEMANTIC_CACHE_SIZE = 256
+# ...except app commands: "open chrome" and "close chrome" embed too closely to share a reply.
+# Same verbs as core.app_launcher's _OPEN_VERBS/_QUIT_VERBS (not imported: that module scans processes).
+_APP_ACTION_RE = re.compile(r"\b(?:" + "|".join(re.escape(v) for v in (
+    'open', 'launch', 'start', 'run', 'bring up', 'pull up', 'fire up', 'boot up', 'pop open',
+    'quit', 'close', 'stop', 'exit', 'kill', 'shut down', 'close out', 'end', 'terminate', 'dismiss',
+)) + r")\b", re.IGNORECASE)
+
+# Content too long for one summary request is summarised map-reduce style: ~3k-token chunks, at most 5 in flight.
+# Without tiktoken, chunks are cut by characters at ~4 chars per token.
+_MAP_CHUNK_TOKENS = 3000
+_CHARS_PER_TOKEN = 4
+_MAP_CONCURRENCY = 5
+_MAP_MAX_TOKENS = 400
+_CHUNK_CACHE_SIZE = 512
+# A failed chunk is retried with backoff; if it still fails the whole summary fails rather than
+# silently leaving that part of the file out. The blocking caller waits at most this long.
+_MAP_RETRIES = 2
+_MAP_RETRY_DELAY = 1.0
+_MAP_REDUCE_TIMEOUT = 180.0
+
+# Single summary requests are capped to fit gpt-3.5-turbo's window alongside the reply.
+# The slack covers per-message framing and the truncation marker.
+_CONTEXT_TOKENS = 16385
+_REQUEST_SLACK_TOKENS = 32
+_TRUNCATED_MARK = "\n\n[TRUNCATED]"
+
+# Users pause 10-30 s between turns; keep pooled connections alive well past that
+_KEEPALIVE_EXPIRY = 180.0
+_WARMUP_TIMEOUT = 3.0
+
+
+def _pooled_client(client):
+    """Move the config client onto a long-lived keep-alive pool so each turn reuses a warm TLS connection."""
+    if client is None or not HTTPX_AVAILABLE:
+        return client
+    try:
+        import h2  # noqa: F401 - HTTP/2 needs the optional h2 package
+        http2 = True
+    except ImportError:
+        http2 = False
+    try:
+        http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50,
+                                keepalive_expiry=_KEEPALIVE_EXPIRY),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=http2,
+        )
+        return client.with_options(http_client=http_client)
+    except Exception as e:
+        print(f"Keep-alive HTTP client unavailable, using default: {e}")
+        return client
+
+
+openai_client = _pooled_client(openai_client)
+
+
+def _warm_connection():
+    """Complete the TCP+TLS handshake while the user is still composing their first prompt."""
+    try:
+        openai_client.with_options(timeout=_WARMUP_TIMEOUT, max_retries=0).models.list()
+    except Exception:
+        pass
+
+
+def _start_warmup():
+    """Warm the pooled connection in the background; called on first real use, never at import."""
+    if OPENAI_AVAILABLE and openai_client is not None:
+        threading.Thread(target=_warm_connection, daemon=True).start()
+
+
+# One background event loop hosts every async request; Tk callers reach it through run_async()
+_async_loop = None
+_async_client = None
+_async_lock = threading.Lock()
+
+
+def _get_async_loop():
+    global _async_loop
+    with _async_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(target=_async_loop.run_forever, name="DeskPilotGPT", daemon=True).start()
+        return _async_loop
+
+
+def _get_async_client():
+    """AsyncOpenAI twin of the config client (same key/base URL), built on first use."""
+    global _async_client
+    if _async_client is None and ASYNC_OPENAI_AVAILABLE and openai_client is not None:
+        kwargs = {"api_key": openai_client.api_key, "base_url": openai_client.base_url,
+                  "organization": openai_client.organization}
+        if HTTPX_AVAILABLE:
+            kwargs["http_client"] = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50,
+                                    keepalive_expiry=_KEEPALIVE_EXPIRY),
+                timeout=httpx.Timeout(30.0, connect=5.0),
+            )
+        _async_client = AsyncOpenAI(**kwargs)
+    return _async_client
+
+
+def run_async(coro, timeout=None):
+    """
+    Run a coroutine on the shared GPT event loop and block for its result (sync shim for UI code).
+    On timeout the coroutine is cancelled and concurrent.futures.TimeoutError raised.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_async_loop())
+    try:
+        return future.result(timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+# System messages are built once; ASSISTANT_NAME/USER_NAME don't change after import
+_DEFAULT_SYSTEM_MSG = (
+    f"You are {ASSISTANT_NAME}, an interactive personal desktop assistant. "
+    f"You help with app launching, file organization, and general productivity tasks. "
+    f"The user prefers to be addressed as '{USER_NAME}'. "
+    f"Keep responses concise and helpful. Always address the user as 'sir'."
+)
+
+_CONTEXT_SYSTEM_MSG = f"You are {ASSISTANT_NAME}, a helpful desktop assistant. Always address the user as 'sir'."
+_CONTEXT_SYSTEM_DICT = {"role": "system", "content": _CONTEXT_SYSTEM_MSG}
+
+_PROMPT_SYSTEM_MSG = (
+    f"You are {ASSISTANT_NAME}, a sophisticated desktop assistant. "
+    f"Create varied, engaging prompts that sound natural and professional. "
+    f"Always address the user as 'sir'. Vary your phrasing to avoid repetition."
+)
+
+_SUMMARISER_GREETING_SYSTEM_MSG = (
+    f"You are {ASSISTANT_NAME}, an AI desktop assistant on the File Summariser page. "
+    f"Address the user as 'sir' (USER_NAME is '{USER_NAME}'). "
+    f"Generate ONE short, friendly greeting (under 14 words) inviting the user to specify how to summarise their uploaded file."
+)
+
+# Strict behaviour for formatting and content-only output
+_SUMMARISER_SYSTEM_MSG = (
+    f"You are {ASSISTANT_NAME}, an expert file summariser for a desktop assistant. "
+    f"Do NOT add salutations, prefaces, apologies, or commentary. Output ONLY the summary text. "
+    f"Follow the requested format exactly. Use clear headings and bullet points where appropriate."
+)
+
+_SUMMARY_FORMAT_RULES = {
+    'timeline': "Produce a chronological timeline as bullet points. Include dates/timestamps if present. No extra prose before/after.",
+    'highlights': "Produce sections with headings: Keywords, Names, Dates, Figures, Topics. Each section uses concise bullet points.",
+    'code': "Produce sections: Purpose, Key Components, Important Lines/Blocks, Potential Issues. Be concise and clear.",
+}
+_SUMMARY_FORMAT_DEFAULT = "Provide a concise summary using short paragraphs or bullet points. Keep it structured and skimmable."
+
+# Enhanced system message for better app launcher integration
+_APP_LAUNCHER_SYSTEM_MSG = (
+    f"You are {ASSISTANT_NAME}, a desktop assistant specializing in app launching and system management. "
+    f"Always address the user as 'sir'. You can help with:\n"
+    f"- Opening applications (Chrome, Safari, VS Code, Spotify, Notes, Terminal, Calculator, etc.)\n"
+    f"- Closing/quitting applications\n"
+    f"- Listing currently running applications\n"
+    f"- General computer tasks and questions\n\n"
+    f"For app requests, be encouraging and confirm what you'll do. "
+    f"If you're unsure about an app name, suggest alternatives. "
+    f"Keep responses concise but helpful."
+)
+
+_INTERPRETER_SYSTEM_MSG = (
+    "You are an expert at parsing voice commands for a desktop assistant. "
+    "Be precise in identifying actions and applications. "
+    "Map common synonyms (e.g., 'browser' -> 'Chrome', 'code' -> 'VS Code')."
+)
+
+_IDENTITY_SYSTEM_MSG = (
+    f"You are {ASSISTANT_NAME}, an interactive AI desktop assistant. "
+    f"Address the user as 'sir' (USER_NAME is '{USER_NAME}'). "
+    f"Respond with ONE concise sentence that introduces yourself and your purpose (desktop/OS assistance). "
+    f"Include the username inline after your name like: '{ASSISTANT_NAME} {USER_NAME}'. "
+    f"Do not include capabilities in this first sentence; the program will append them."
+)
+
+# One pass over an interpretation reply: each "FIELD: value" line at the start of a line
+_APP_CMD_RE = re.compile(r"^(ACTION|APP|CONFIDENCE):(.*)$", re.MULTILINE)
+# A reply wrapped whole in one code fence, optionally tagged (```markdown ... ```)
+_FENCE_RE = re.compile(r"```(?:[\w+-]*\n)?(.*?)\n?```", re.DOTALL)
+
+_APP_CMD_FIELDS = {"ACTION": "action", "APP": "app", "CONFIDENCE": "confidence"}
+
+# Map step: neutral partial summaries, so they can be reused whatever the final instruction is
+_CHUNK_SYSTEM_MSG = (
+    "You condense one excerpt of a longer file. Output ONLY a faithful, compact summary of the excerpt. "
+    "Keep every date, name, figure, heading and code identifier that appears. No prefaces or commentary."
+)
+
+_NAME_SYSTEM_MSG = (
+    f"You are {ASSISTANT_NAME}, an AI desktop assistant. Always address the user as 'sir' (USER_NAME is '{USER_NAME}'). "
+    f"Answer the question 'what is your name?' in ONE short sentence including your name. Keep under 12 words."
+)
+
+
+class CircuitOpen(Exception):
+    """Raised by the GPT calls while recent calls keep failing, so callers fall back immediately."""
+
+
+# After 3 consecutive failures every GPT call fails fast for 30 s, then ONE trial call goes through
+# (half-open); the rest keep failing fast until it succeeds. A probe that never reports back
+# (e.g. cancelled) frees the slot after another cooldown.
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 30.0
+_breaker = {"fails": 0, "opened_at": 0.0, "probe_at": None}
+_breaker_lock = threading.Lock()
+
+
+def _breaker_check():
+    with _breaker_lock:
+        if _breaker["fails"] < _BREAKER_THRESHOLD:
+            return
+        now = time.monotonic()
+        if now - _breaker["opened_at"] < _BREAKER_COOLDOWN:
+            raise CircuitOpen("GPT is temporarily unavailable")
+        if _breaker["probe_at"] is not None and now - _breaker["probe_at"] < _BREAKER_COOLDOWN:
+            raise CircuitOpen("GPT is temporarily unavailable")
+        _breaker["probe_at"] = now
+
+
+def _breaker_record(ok):
+    with _breaker_lock:
+        _breaker["probe_at"] = None
+        if ok:
+            _breaker["fails"] = 0
+        else:
+            _breaker["fails"] += 1
+            _breaker["opened_at"] = time.monotonic()
+
 
 # existing ask_gpt function retained for direct calls
 def ask_gpt(prompt, system_message=None):
     """
     Send a prompt to GPT-3.5-turbo and return the response
+    Raises CircuitOpen instead of waiting on the network while the endpoint keeps failing.
     """
+    _breaker_check()
     try:
         # Check if OpenAI is available
         if not OPENAI_AVAILABLE or openai_client is None:
             return f"Sorry {USER_NAME}, OpenAI integration is not available. Please check your API key."
 
-        if system_message is None:
-            system_message = (
-                f"You are {ASSISTANT_NAME}, an interactive personal desktop assistant. "
-                f"You help with app launching, file organization, and general productivity tasks. "
-                f"The user prefers to be addressed as '{USER_NAME}'. "
-                f"Keep responses concise and helpful. Always address the user as 'sir'."
-            )
+        system_message = system_message or _DEFAULT_SYSTEM_MSG
         response = openai_client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
@@ -36,8 +298,10 @@ def ask_gpt(prompt, system_message=None):
             temperature=TEMPERATURE,
         )
         answer = response.choices[0].message.content
+        _breaker_record(True)
         return answer.strip()
     except Exception as e:
+        _breaker_record(False)
         print(f"Error communicating with GPT: {e}")
         return f"Sorry {USER_NAME}, I'm having trouble processing that request right now."
 
@@ -45,20 +309,17 @@ def ask_gpt(prompt, system_message=None):
 def ask_gpt_with_context(prompt, context_messages):
     """
     Send a prompt with conversation context to GPT
+    Raises CircuitOpen like ask_gpt.
     """
+    _breaker_check()
     try:
         # Check if OpenAI is available
         if not OPENAI_AVAILABLE or openai_client is None:
             return f"Sorry {USER_NAME}, OpenAI integration is not available. Please check your API key."
 
-        if not context_messages or context_messages[0]["role"] != "system":
-            system_msg = {
-                "role": "system",
-                "content": f"You are {ASSISTANT_NAME}, a helpful desktop assistant. Always address the user as 'sir'."
-            }
-            context_messages.insert(0, system_msg)
-
-        messages = context_messages + [{"role": "user", "content": prompt}]
+        # Build a fresh list; the caller's history is never modified
+        needs_sys = not context_messages or context_messages[0]["role"] != "system"
+        messages = ([_CONTEXT_SYSTEM_DICT] if needs_sys else []) + list(context_messages) + [{"role": "user", "content": prompt}]
 
         response = openai_client.chat.completions.create(
             model="gpt-3.5-turbo",
@@ -66,33 +327,190 @@ def ask_gpt_with_context(prompt, context_messages):
             max_tokens=MAX_TOKENS,
             temperature=TEMPERATURE,
         )
-
-        return response.choices[0].message.content.strip()
+        answer = response.choices[0].message.content
+        _breaker_record(True)
+        return answer.strip()
     except Exception as e:
+        _breaker_record(False)
         print(f"Error in GPT conversation: {e}")
         return f"Sorry {USER_NAME}, I encountered an error during our conversation."
 
 
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """gpt-3.5-turbo tokenizer, loaded once; None if tiktoken isn't installed."""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("gpt-3.5-turbo")
+    except Exception:
+        return None
+
+
+def _split_by_tokens(content, max_tokens=_MAP_CHUNK_TOKENS):
+    """Split content into pieces of at most max_tokens (approximate without tiktoken)."""
+    enc = _get_encoding()
+    if enc is not None:
+        ids = enc.encode(content)
+        return [enc.decode(ids[i:i + max_tokens]) for i in range(0, len(ids), max_tokens)] or [content]
+    max_chars = max_tokens * _CHARS_PER_TOKEN
+    chunks = []
+    start = 0
+    while len(content) - start > max_chars:
+        # Prefer to cut at a line break
+        cut = content.rfind('\n', start, start + max_chars)
+        if cut <= start:
+            cut = start + max_chars
+        chunks.append(content[start:cut])
+        start = cut
+    chunks.append(content[start:])
+    return chunks
+
+
+def _count_tokens(text):
+    enc = _get_encoding()
+    return len(enc.encode(text)) if enc is not None else -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def _truncate_to_tokens(text, budget):
+    """text cut to at most budget tokens (approximate without tiktoken), marked if anything was dropped."""
+    budget = max(budget, 0)
+    enc = _get_encoding()
+    if enc is None:
+        limit = budget * _CHARS_PER_TOKEN
+        return text if len(text) <= limit else text[:limit] + _TRUNCATED_MARK
+    ids = enc.encode(text)
+    if len(ids) <= budget:
+        return text
+    return enc.decode(ids[:budget]) + _TRUNCATED_MARK
+
+
+class _SemanticCache:
+    """
+    Unit-norm prompt embeddings stacked in one float32 matrix, so a lookup is a single matvec.
+    Replies expire after ttl seconds, like the exact-match response cache.
+    """
+
+    def __init__(self, threshold=_SEMANTIC_THRESHOLD, maxsize=_SEMANTIC_CACHE_SIZE, ttl=_RESPONSE_CACHE_TTL):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._matrix = None  # (capacity, dim); rows [:_count] are filled
+        self._responses = []
+        self._added = []
+        self._last_used = []
+        self._count = 0
+
+    def is_warm(self):
+        """True if any reply is still fresh, i.e. a lookup could hit and an embedding is worth fetching."""
+        cutoff = time.monotonic() - self.ttl
+        with self._lock:
+            return any(t > cutoff for t in self._added)
+
+    def lookup(self, emb):
+        with self._lock:
+            if not self._count:
+                return None
+            now = time.monotonic()
+            sims = self._matrix[:self._count] @ emb
+            expired = np.fromiter((now - t >= self.ttl for t in self._added), dtype=bool, count=self._count)
+            sims[expired] = -1.0
+            i = int(sims.argmax())
+            if sims[i] <= self.threshold:
+                return None
+            self._last_used[i] = now
+            return self._responses[i]
+
+    def add(self, emb, response):
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.empty((16, emb.shape[0]), dtype=np.float32)
+            if self._count >= self.maxsize:
+                # Full: overwrite the least recently used row in place
+                i = min(range(self._count), key=self._last_used.__getitem__)
+                self._responses[i] = response
+                self._added[i] = self._last_used[i] = time.monotonic()
+            else:
+                if self._count == self._matrix.shape[0]:
+                    # Double capacity so rows stay contiguous for the matvec
+                    grown = np.empty((min(2 * self._count, self.maxsize), self._matrix.shape[1]), dtype=np.float32)
+                    grown[:self._count] = self._matrix
+                    self._matrix = grown
+                i = self._count
+                self._count += 1
+                self._responses.append(response)
+                now = time.monotonic()
+                self._added.append(now)
+                self._last_used.append(now)
+            self._matrix[i] = emb
+
+
+def _embed(text):
+    """Unit-norm float32 embedding of text, or None if embeddings aren't available."""
+    if not NUMPY_AVAILABLE or not OPENAI_AVAILABLE or openai_client is None:
+        return None
+    try:
+        resp = openai_client.embeddings.create(model=_EMBEDDING_MODEL, input=text)
+        vec = np.asarray(resp.data[0].embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else None
+    except Exception as e:
+        print(f"Embedding failed, skipping semantic cache: {e}")
+        return None
+
+
 class GPTHandler:
     """
     Enhanced GPT handler for dynamic prompts, app launcher integration, and file summarisation.
     """
 
+    # (system message, prompt) -> (timestamp, answer); shared so every page's handler hits the same cache
+    _response_cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    stats = {"hits": 0, "misses": 0, "semantic_hits": 0}
+    # sha256(chunk) -> partial summary, so re-summarising a file with a new instruction reuses the map step
+    _chunk_cache = OrderedDict()
+    _semantic_cache = _SemanticCache() if NUMPY_AVAILABLE else None
+
     def __init__(self):
+        # Track recent prompts to avoid repetition; the deque evicts the oldest itself
+        self._max_recent = 3
+        self._recent_prompts = deque(maxlen=self._max_recent)
+        self._recent_counts = Counter()
+
+    # Fallback state below is built on first use, so handlers that always reach GPT never pay for it
+
+    @functools.cached_property
+    def _local_prompts(self):
         # Local fallback prompts for quickness / offline dev
-        self._local_prompts = [
+        return (
             "What would you like to do, sir?",
             "How can I help you today, sir?",
             "Shall I open something for you, sir?",
             "What can I do for you, sir?",
             "Ready to assist you, sir. What shall we work on?",
             "What application would you like me to help with, sir?",
-            "How may I be of service, sir?"
-        ]
+            "How may I be of service, sir?",
+        )
 
-        # Track recent prompts to avoid repetition
-        self._recent_prompts = []
-        self._max_recent = 3
+    @functools.cached_property
+    def _local_set(self):
+        return frozenset(self._local_prompts)
+
+    @functools.cached_property
+    def _available(self):
+        # Local prompts not used recently, as a list (for choice) plus positions (for O(1) removal)
+        return [p for p in self._local_prompts if p not in self._recent_counts]
+
+    @functools.cached_property
+    def _available_pos(self):
+        return {p: i for i, p in enumerate(self._available)}
+
+    @functools.cached_property
+    def _rng(self):
+        # Own generator so picks don't contend on the shared module-level one
+        import random
+        return random.Random()
 
     def get_dynamic_prompt(self):
         """Get a varied, conversational prompt from GPT or fallback to local variants."""
@@ -110,25 +528,22 @@ class GPTHandler:
                 "or ask questions. Keep it to one sentence under 15 words."
             )
 
-            system_msg = (
-                f"You are {ASSISTANT_NAME}, a sophisticated desktop assistant. "
-                f"Create varied, engaging prompts that sound natural and professional. "
-                f"Always address the user as 'sir'. Vary your phrasing to avoid repetition."
-            )
-
-            response = ask_gpt(gpt_request, system_message=system_msg)
+            response = ask_gpt(gpt_request, system_message=_PROMPT_SYSTEM_MSG)
+            # ask_gpt reports failures as a "Sorry <user>, ..." reply; that's no greeting
+            if response.startswith(f"Sorry {USER_NAME}"):
+                return self._get_local_prompt()
 
             # Clean up the response
             first_line = response.split('\n')[0].strip()
             if len(first_line) > 0 and len(first_line) < 100:
-                # Store in recent prompts and rotate if needed
-                self._recent_prompts.append(first_line)
-                if len(self._recent_prompts) > self._max_recent:
-                    self._recent_prompts.pop(0)
+                # Store in recent prompts (oldest drops off automatically)
+                self._remember_prompt(first_line)
                 return first_line
             else:
                 raise ValueError("GPT response too long or empty")
 
+        except CircuitOpen:
+            return self._get_local_prompt()
         except Exception as e:
             print(f"GPT prompt generation failed: {e}")
             return self._get_local_prompt()
@@ -136,17 +551,58 @@ class GPTHandler:
     def _get_local_prompt(self):
         """Get a local fallback prompt"""
         # Return a local prompt that wasn't used recently
-        available_prompts = [p for p in self._local_prompts if p not in self._recent_prompts]
-        if not available_prompts:
-            available_prompts = self._local_prompts
-
-        chosen_prompt = random.choice(available_prompts)
-        self._recent_prompts.append(chosen_prompt)
-        if len(self._recent_prompts) > self._max_recent:
-            self._recent_prompts.pop(0)
+        chosen_prompt = self._rng.choice(self._available or self._local_prompts)
+        self._remember_prompt(chosen_prompt)
 
         return chosen_prompt
 
+    def _remember_prompt(self, prompt):
+        """Record prompt as recent, keeping the available pool in step with what drops off."""
+        # Before the pool exists only the counts matter; it is built from them on first use
+        pooled = '_available' in self.__dict__
+        if len(self._recent_prompts) == self._recent_prompts.maxlen:
+            evicted = self._recent_prompts[0]
+            self._recent_counts[evicted] -= 1
+            if not self._recent_counts[evicted]:
+                del self._recent_counts[evicted]
+                if pooled and evicted in self._local_set and evicted not in self._available_pos:
+                    self._available_pos[evicted] = len(self._available)
+                    self._available.append(evicted)
+        self._recent_prompts.append(prompt)
+        self._recent_counts[prompt] += 1
+        if not pooled:
+            return
+        i = self._available_pos.pop(prompt, None)
+        if i is not None:
+            # Swap the last entry into the hole so removal stays O(1)
+            last = self._available.pop()
+            if i < len(self._available):
+                self._available[i] = last
+                self._available_pos[last] = i
+
+    def _ask_gpt_cached(self, prompt, system_message):
+        """ask_gpt with a TTL + LRU cache; error replies are never cached."""
+        key = (system_message, prompt)
+        now = time.monotonic()
+        cls = GPTHandler
+        with cls._cache_lock:
+            entry = cls._response_cache.get(key)
+            if entry and now - entry[0] < _RESPONSE_CACHE_TTL:
+                cls._response_cache.move_to_end(key)
+                cls.stats["hits"] += 1
+                return entry[1]
+            cls.stats["misses"] += 1
+
+        answer = ask_gpt(prompt, system_message=system_message)
+        # Failures come back as "Sorry <user>, ..." strings; don't pin those for an hour
+        if answer and not answer.startswith(f"Sorry {USER_NAME}"):
+            with cls._cache_lock:
+                cls._response_cache[key] = (now, answer)
+                cls._response_cache.move_to_end(key)
+                while len(cls._response_cache) > _RESPONSE_CACHE_SIZE:
+                    cls._response_cache.popitem(last=False)
+        return answer
+
     def get_summariser_prompt(self):
         """Get a varied, concise greeting for the File Summariser page.
         Uses GPT when available; falls back to local variants that address the user.
@@ -160,18 +616,13 @@ class GPTHandler:
                     f"How should I summarise your file today, {USER_NAME}?",
                     f"I'm set to summarise — just tell me the style, {USER_NAME}."
                 ]
-                return random.choice(local)
+                return self._rng.choice(local)
 
-            system_msg = (
-                f"You are {ASSISTANT_NAME}, an AI desktop assistant on the File Summariser page. "
-                f"Address the user as 'sir' (USER_NAME is '{USER_NAME}'). "
-                f"Generate ONE short, friendly greeting (under 14 words) inviting the user to specify how to summarise their uploaded file."
-            )
             prompt = (
                 "Produce a single sentence greeting asking how you'd summarise the uploaded file. "
                 "Offer gentle guidance, e.g., timeline or bullet points."
             )
-            resp = ask_gpt(prompt, system_message=system_msg) or ""
+            resp = ask_gpt(prompt, system_message=_SUMMARISER_GREETING_SYSTEM_MSG) or ""
             first = resp.split('\n')[0].strip()
             if not first:
                 return f"How would you like me to summarise this file, {USER_NAME}?"
@@ -187,55 +638,159 @@ class GPTHandler:
         try:
             if not OPENAI_AVAILABLE or openai_client is None:
                 return ''
-
-            # System: strict behaviour for formatting and content-only output
-            system_msg = (
-                f"You are {ASSISTANT_NAME}, an expert file summariser for a desktop assistant. "
-                f"Do NOT add salutations, prefaces, apologies, or commentary. Output ONLY the summary text. "
-                f"Follow the requested format exactly. Use clear headings and bullet points where appropriate."
+            _breaker_check()
+            resp = openai_client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=self._summary_messages(content, instruction, kind, filename, max_tokens),
+                max_tokens=max_tokens,
+                temperature=temperature,
             )
+            out = resp.choices[0].message.content
+            _breaker_record(True)
+            return self._clean_summary(out)
+        except CircuitOpen:
+            return ''
+        except Exception as e:
+            _breaker_record(False)
+            print(f"Error summarising with GPT: {e}")
+            return ''
 
-            # Instruction wrapper with format constraints by kind
-            format_rules = []
-            k = (kind or '').lower().strip()
-            if k == 'timeline':
-                format_rules.append("Produce a chronological timeline as bullet points. Include dates/timestamps if present. No extra prose before/after.")
-            elif k == 'highlights':
-                format_rules.append("Produce sections with headings: Keywords, Names, Dates, Figures, Topics. Each section uses concise bullet points.")
-            elif k == 'code':
-                format_rules.append("Produce sections: Purpose, Key Components, Important Lines/Blocks, Potential Issues. Be concise and clear.")
-            else:
-                format_rules.append("Provide a concise summary using short paragraphs or bullet points. Keep it structured and skimmable.")
-
-            # Respect the user's instruction for custom format
-            user_req = (instruction or '').strip()
-            if user_req:
-                format_rules.append(f"User request: {user_req}")
+    def summarize_long(self, content: str, instruction: str, kind: str, filename: str, max_tokens: int = 900, temperature: float = 0.5) -> str:
+        """
+        summarize for content of any length: content that doesn't fit one summary request is summarised
+        chunk by chunk concurrently, then the partial summaries are summarised per instruction and kind.
+        """
+        if not OPENAI_AVAILABLE or openai_client is None:
+            return ''
+        if _count_tokens(content) <= self._summary_budget(instruction, kind, filename, max_tokens)[2]:
+            return self.summarize(content, instruction, kind, filename, max_tokens, temperature)
+        try:
+            return run_async(self._amap_reduce(_split_by_tokens(content), instruction, kind, filename, max_tokens, temperature),
+                             timeout=_MAP_REDUCE_TIMEOUT)
+        except Exception as e:
+            print(f"Map-reduce summary failed: {e}")
+            return ''
 
-            prompt = (
-                f"File: {filename}\n\n"
-                f"CONTENT (truncated if long):\n{content}\n\n"
-                f"FORMAT & TASK:\n- " + "\n- ".join(format_rules)
-            )
+    async def _amap_reduce(self, chunks, instruction, kind, filename, max_tokens, temperature):
+        sem = asyncio.Semaphore(_MAP_CONCURRENCY)
+
+        async def _one(chunk):
+            for attempt in range(_MAP_RETRIES + 1):
+                if attempt:
+                    # Back off outside the semaphore so other chunks keep going
+                    await asyncio.sleep(_MAP_RETRY_DELAY * 2 ** (attempt - 1))
+                async with sem:
+                    partial = await self._asummarize_chunk(chunk, filename)
+                if partial:
+                    return partial
+            return ''
 
-            resp = openai_client.chat.completions.create(
+        partials = await asyncio.gather(*[_one(c) for c in chunks])
+        if not all(partials):
+            # A summary missing whole sections would read as complete; let the caller fall back
+            print(f"Map-reduce summary failed: {partials.count('')} of {len(partials)} chunks could not be summarised")
+            return ''
+        combined = "\n\n".join(partials)
+        if _count_tokens(combined) > self._summary_budget(instruction, kind, filename, max_tokens)[2]:
+            # Very long files: the partials themselves need another round
+            return await self._amap_reduce(_split_by_tokens(combined), instruction, kind, filename, max_tokens, temperature)
+        return await self.asummarize(combined, instruction, kind, filename, max_tokens, temperature)
+
+    async def _asummarize_chunk(self, chunk, filename):
+        """Partial summary of one chunk, cached by content hash; '' on failure."""
+        key = hashlib.sha256(chunk.encode('utf-8', 'surrogatepass')).hexdigest()
+        cls = GPTHandler
+        with cls._cache_lock:
+            if key in cls._chunk_cache:
+                cls._chunk_cache.move_to_end(key)
+                return cls._chunk_cache[key]
+        try:
+            client = _get_async_client()
+            if client is None:
+                return ''
+            _breaker_check()
+            resp = await client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
-                    {"role": "system", "content": system_msg},
-                    {"role": "user", "content": prompt}
+                    {"role": "system", "content": _CHUNK_SYSTEM_MSG},
+                    {"role": "user", "content": f"Excerpt from {filename}:\n\n{chunk}"}
                 ],
+                max_tokens=_MAP_MAX_TOKENS,
+                temperature=0.2,
+            )
+            partial = (resp.choices[0].message.content or '').strip()
+            _breaker_record(True)
+        except CircuitOpen:
+            return ''
+        except Exception as e:
+            _breaker_record(False)
+            print(f"Chunk summary failed: {e}")
+            return ''
+        if partial:
+            with cls._cache_lock:
+                cls._chunk_cache[key] = partial
+                while len(cls._chunk_cache) > _CHUNK_CACHE_SIZE:
+                    cls._chunk_cache.popitem(last=False)
+        return partial
+
+    async def asummarize(self, content: str, instruction: str, kind: str, filename: str, max_tokens: int = 900, temperature: float = 0.5) -> str:
+        """Async summarize, so a long summary doesn't hold shorter prompt calls behind it."""
+        try:
+            client = _get_async_client()
+            if not OPENAI_AVAILABLE or client is None:
+                return ''
+            _breaker_check()
+            resp = await client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=self._summary_messages(content, instruction, kind, filename, max_tokens),
                 max_tokens=max_tokens,
                 temperature=temperature,
             )
-            out = (resp.choices[0].message.content or '').strip()
-            # Clean common wrappers
-            if out.startswith("```") and out.endswith("```"):
-                out = out.strip('`')
-            return out
+            out = resp.choices[0].message.content
+            _breaker_record(True)
+            return self._clean_summary(out)
+        except CircuitOpen:
+            return ''
         except Exception as e:
-            # Log-friendly string could be printed by caller if needed
+            _breaker_record(False)
             return ''
 
+    @staticmethod
+    def _clean_summary(out):
+        out = (out or '').strip()
+        # Clean common wrappers: drop exactly one enclosing fence (and its language tag), not every backtick
+        m = _FENCE_RE.fullmatch(out)
+        return m.group(1).strip('\n') if m else out
+
+    @staticmethod
+    def _summary_messages(content, instruction, kind, filename, max_tokens=900):
+        """Build the system/user messages for a summary request, cutting content to what fits the model window."""
+        head, tail, budget = GPTHandler._summary_budget(instruction, kind, filename, max_tokens)
+        prompt = head + _truncate_to_tokens(content, budget) + tail
+
+        return [
+            {"role": "system", "content": _SUMMARISER_SYSTEM_MSG},
+            {"role": "user", "content": prompt}
+        ]
+
+    @staticmethod
+    def _summary_budget(instruction, kind, filename, max_tokens=900):
+        """(head, tail, content token budget) for a single summary request."""
+        # Instruction wrapper with format constraints by kind
+        k = (kind or '').lower().strip()
+        format_rules = [_SUMMARY_FORMAT_RULES.get(k, _SUMMARY_FORMAT_DEFAULT)]
+
+        # Respect the user's instruction for custom format
+        user_req = (instruction or '').strip()
+        if user_req:
+            format_rules.append(f"User request: {user_req}")
+
+        head = f"File: {filename}\n\nCONTENT (truncated if long):\n"
+        tail = "\n\nFORMAT & TASK:\n- " + "\n- ".join(format_rules)
+        budget = (_CONTEXT_TOKENS - max_tokens - _REQUEST_SLACK_TOKENS
+                  - _count_tokens(_SUMMARISER_SYSTEM_MSG) - _count_tokens(head) - _count_tokens(tail))
+        return head, tail, budget
+
     def get_response(self, user_prompt):
         """Return a helpful response to a user prompt with app launcher context."""
         try:
@@ -243,23 +798,34 @@ class GPTHandler:
             if not OPENAI_AVAILABLE or openai_client is None:
                 return f"Sorry {USER_NAME}, I don't have access to GPT right now. Please check the OpenAI API configuration."
 
-            # Enhanced system message for better app launcher integration
-            system_msg = (
-                f"You are {ASSISTANT_NAME}, a desktop assistant specializing in app launching and system management. "
-                f"Always address the user as 'sir'. You can help with:\n"
-                f"- Opening applications (Chrome, Safari, VS Code, Spotify, Notes, Terminal, Calculator, etc.)\n"
-                f"- Closing/quitting applications\n"
-                f"- Listing currently running applications\n"
-                f"- General computer tasks and questions\n\n"
-                f"For app requests, be encouraging and confirm what you'll do. "
-                f"If you're unsure about an app name, suggest alternatives. "
-                f"Keep responses concise but helpful."
-            )
-
-            return ask_gpt(user_prompt, system_message=system_msg)
+            # App commands skip the semantic cache (and its embedding round-trip) entirely
+            cache = self._semantic_cache
+            use_semantic = cache is not None and not _APP_ACTION_RE.search(user_prompt)
+            # With nothing fresh to match against, don't hold the reply behind an embedding call
+            emb = _embed(user_prompt) if use_semantic and cache.is_warm() else None
+            if emb is not None:
+                cached = cache.lookup(emb)
+                if cached is not None:
+                    with GPTHandler._cache_lock:
+                        GPTHandler.stats["semantic_hits"] += 1
+                    return cached
+
+            answer = ask_gpt(user_prompt, system_message=_APP_LAUNCHER_SYSTEM_MSG)
+            if use_semantic and answer and not answer.startswith(f"Sorry {USER_NAME}"):
+                if emb is not None:
+                    cache.add(emb, answer)
+                else:
+                    # Cold cache: embed after replying, off the caller's thread
+                    threading.Thread(target=self._remember_semantic, args=(user_prompt, answer), daemon=True).start()
+            return answer
         except Exception as e:
             return f"Sorry sir, I couldn't process that — {e}"
 
+    def _remember_semantic(self, prompt, answer):
+        emb = _embed(prompt)
+        if emb is not None:
+            self._semantic_cache.add(emb, answer)
+
     def interpret_app_command(self, command):
         """
         Interpret voice commands for app operations using GPT.
@@ -270,43 +836,37 @@ class GPTHandler:
             if not OPENAI_AVAILABLE or openai_client is None:
                 return {'action': 'unknown', 'app': 'none', 'confidence': 'low', 'error': 'OpenAI not available'}
 
-            gpt_request = (
-                f"Analyze this voice command: '{command}'\n\n"
-                f"Determine:\n"
-                f"1. What action is requested (open, launch, start, quit, close, stop, list running apps)\n"
-                f"2. Which application (if any) is mentioned\n\n"
-                f"Respond in this format:\n"
-                f"ACTION: [open/quit/list/unknown]\n"
-                f"APP: [application name or 'none']\n"
-                f"CONFIDENCE: [high/medium/low]\n\n"
-                f"Common apps include: Chrome, Safari, Firefox, VS Code, Spotify, Notes, Terminal, Calculator, Mail, Calendar"
-            )
+            response = ask_gpt(self._app_command_request(command), system_message=_INTERPRETER_SYSTEM_MSG)
+            return self._parse_app_command(response)
 
-            system_msg = (
-                "You are an expert at parsing voice commands for a desktop assistant. "
-                "Be precise in identifying actions and applications. "
-                "Map common synonyms (e.g., 'browser' -> 'Chrome', 'code' -> 'VS Code')."
-            )
-
-            response = ask_gpt(gpt_request, system_message=system_msg)
+        except Exception as e:
+            print(f"Error interpreting command: {e}")
+            return {'action': 'unknown', 'app': 'none', 'confidence': 'low', 'error': str(e)}
 
-            # Parse the structured response
-            lines = response.split('\n')
-            result = {'action': 'unknown', 'app': 'none', 'confidence': 'low'}
+    @staticmethod
+    def _app_command_request(command):
+        return (
+            f"Analyze this voice command: '{command}'\n\n"
+            f"Determine:\n"
+            f"1. What action is requested (open, launch, start, quit, close, stop, list running apps)\n"
+            f"2. Which application (if any) is mentioned\n\n"
+            f"Respond in this format:\n"
+            f"ACTION: [open/quit/list/unknown]\n"
+            f"APP: [application name or 'none']\n"
+            f"CONFIDENCE: [high/medium/low]\n\n"
+            f"Common apps include: Chrome, Safari, Firefox, VS Code, Spotify, Notes, Terminal, Calculator, Mail, Calendar"
+        )
 
-            for line in lines:
-                if line.startswith('ACTION:'):
-                    result['action'] = line.split(':', 1)[1].strip().lower()
-                elif line.startswith('APP:'):
-                    result['app'] = line.split(':', 1)[1].strip()
-                elif line.startswith('CONFIDENCE:'):
-                    result['confidence'] = line.split(':', 1)[1].strip().lower()
+    @staticmethod
+    def _parse_app_command(response):
+        """Parse the ACTION/APP/CONFIDENCE lines of an interpretation reply."""
+        result = {'action': 'unknown', 'app': 'none', 'confidence': 'low'}
 
-            return result
+        for m in _APP_CMD_RE.finditer(response):
+            field, value = _APP_CMD_FIELDS[m.group(1)], m.group(2).strip()
+            result[field] = value if field == 'app' else value.lower()
 
-        except Exception as e:
-            print(f"Error interpreting command: {e}")
-            return {'action': 'unknown', 'app': 'none', 'confidence': 'low', 'error': str(e)}
+        return result
 
     def get_app_suggestion(self, failed_app_name):
         """Get GPT's suggestion for an app that couldn't be found."""
@@ -339,24 +899,17 @@ class GPTHandler:
         ]
         try:
             if not OPENAI_AVAILABLE or openai_client is None:
-                intro = random.choice(local_variants)
+                intro = self._rng.choice(local_variants)
                 return f"{intro} {capability_line}"
 
-            system_msg = (
-                f"You are {ASSISTANT_NAME}, an interactive AI desktop assistant. "
-                f"Address the user as 'sir' (USER_NAME is '{USER_NAME}'). "
-                f"Respond with ONE concise sentence that introduces yourself and your purpose (desktop/OS assistance). "
-                f"Include the username inline after your name like: '{ASSISTANT_NAME} {USER_NAME}'. "
-                f"Do not include capabilities in this first sentence; the program will append them."
-            )
             prompt = (
                 "Introduce yourself to the user in one sentence. "
                 "Keep it under 30 words, professional and personable."
             )
-            intro = ask_gpt(prompt, system_message=system_msg)
+            intro = self._ask_gpt_cached(prompt, _IDENTITY_SYSTEM_MSG)
             intro = (intro or '').strip()
             if not intro:
-                intro = random.choice(local_variants)
+                intro = self._rng.choice(local_variants)
             # Ensure the assistant and username appear; if not, enforce it
             if ASSISTANT_NAME not in intro:
                 intro = f"I am {ASSISTANT_NAME} {USER_NAME}, an interactive AI assistant for your desktop."
@@ -365,7 +918,7 @@ class GPTHandler:
                 intro = intro.replace(ASSISTANT_NAME, f"{ASSISTANT_NAME} {USER_NAME}")
             return f"{intro} {capability_line}"
         except Exception as e:
-            intro = random.choice(local_variants)
+            intro = self._rng.choice(local_variants)
             return f"{intro} {capability_line}"
 
     def get_name_response(self):
@@ -381,17 +934,13 @@ class GPTHandler:
         ]
         try:
             if not OPENAI_AVAILABLE or openai_client is None:
-                return random.choice(local_variants)
+                return self._rng.choice(local_variants)
 
-            system_msg = (
-                f"You are {ASSISTANT_NAME}, an AI desktop assistant. Always address the user as 'sir' (USER_NAME is '{USER_NAME}'). "
-                f"Answer the question 'what is your name?' in ONE short sentence including your name. Keep under 12 words."
-            )
             prompt = "State your name to the user. Keep it brief and polite."
-            ans = ask_gpt(prompt, system_message=system_msg)
+            ans = self._ask_gpt_cached(prompt, _NAME_SYSTEM_MSG)
             ans = (ans or '').strip()
             if not ans:
-                return random.choice(local_variants)
+                return self._rng.choice(local_variants)
             # Ensure assistant name appears; if not, enforce it
             if ASSISTANT_NAME.lower() not in ans.lower():
                 ans = f"My name is {ASSISTANT_NAME}, {USER_NAME}."
@@ -401,4 +950,12 @@ class GPTHandler:
                 ans = ans.rstrip('.') + f", {USER_NAME}."
             return ans
         except Exception:
-            return random.choice(local_variants)
\ No newline at end of file
+            return self._rng.choice(local_variants)
+
+
+@functools.lru_cache(maxsize=1)
+def get_gpt_handler():
+    """The process-wide GPTHandler, so every screen shares its prompt rotation and warm state."""
+    # First use is the first sign GPT will actually be needed: open the connection now
+    _start_warmup()
+    return GPTHandler()
@@ -0,0 +1 @@
+"""DeskPilot Tk screens."""
@@ -1,14 +1,26 @@
 import tkinter as tk
 from tkinterweb import HtmlFrame
 import threading
-import sys
+import functools
+import atexit
 from pathlib import Path
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directory for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Most transcription lines kept; older ones are dropped rather than piling up in the page
+_MAX_TRANSCRIPTION_LINES = 500
 
-from core.app_launcher import open_vscode, open_safari, quit_spotify
+# Voice sessions run on reused workers rather than a fresh thread per click
+_VOICE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="AppLauncher")
+atexit.register(_VOICE_POOL.shutdown, wait=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_voice_handler():
+    """VoiceHandler built on first voice use; importing it pulls in speech recognition, TTS and GPT."""
+    from voice.voice_handler import VoiceHandler
+    return VoiceHandler()
 
 
 class AppLauncherHTMLGUI:
@@ -18,6 +30,10 @@ class AppLauncherHTMLGUI:
         self.root = root
         self.main_menu = main_menu
         self.html_frame = None
+        # Transcription lines waiting for the next idle flush (one JS call per burst), bounded
+        self._pending_lines = deque(maxlen=_MAX_TRANSCRIPTION_LINES)
+        self._flush_lock = threading.Lock()
+        self._flush_scheduled = False
         self.setup_ui()
 
     def setup_ui(self):
@@ -69,6 +85,8 @@ class AppLauncherHTMLGUI:
     def execute_command(self, command):
         """Execute commands from HTML interface"""
         self.add_to_transcription(f"(User) clicked: {command}")
+        # Imported on first click: the launcher scans processes and installed apps
+        from core.app_launcher import open_vscode, open_safari, quit_spotify
 
         try:
             if command == "open_vscode":
@@ -101,20 +119,23 @@ class AppLauncherHTMLGUI:
     def start_voice_interaction(self):
         """Handle voice interaction"""
 
-        def voice_thread():
-            try:
-                self.add_to_transcription("(System) Starting voice session...")
-                # Use the existing voice handler
-                self.voice_handler.start_voice_interaction()
-            except Exception as e:
-                self.add_to_transcription(f"(System) Voice error: {e}")
-            finally:
-                # Reset speak button
-                self._reset_speak_button()
-
-        # Start in separate thread
-        thread = threading.Thread(target=voice_thread, daemon=True)
-        thread.start()
+        def voice_session():
+            self.add_to_transcription("(System) Starting voice session...")
+            # Use the shared voice handler, created on first use
+            _get_voice_handler().start_voice_interaction()
+
+        # Run on the voice pool; the done-callback reports errors and resets the button
+        _VOICE_POOL.submit(voice_session).add_done_callback(self._voice_session_done)
+
+    def _voice_session_done(self, future):
+        """Report a failed voice session and reset the speak button on the Tk thread"""
+        exc = future.exception()
+        if exc is not None:
+            self.add_to_transcription(f"(System) Voice error: {exc}")
+        try:
+            self.root.after(0, self._reset_speak_button)
+        except Exception:
+            self._reset_speak_button()
 
     def get_running_apps(self):
         """Get and display running applications"""
@@ -140,11 +161,31 @@ class AppLauncherHTMLGUI:
             pass
 
     def add_to_transcription(self, text):
-        """Add text to the transcription box"""
+        """Add text to the transcription box (queued; a burst of lines is written in one go when Tk is idle)"""
+        self._pending_lines.append(text)
+        with self._flush_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            self.root.after_idle(self._flush_transcription)
+        except Exception:
+            # No Tk loop to schedule on: write straight away
+            self._flush_transcription()
+
+    def _flush_transcription(self):
+        """Write every queued transcription line with a single JS call"""
+        with self._flush_lock:
+            self._flush_scheduled = False
+        lines = []
+        while self._pending_lines:
+            lines.append(self._pending_lines.popleft())
+        if not lines:
+            return
         try:
-            # Escape text for JavaScript
-            escaped_text = text.replace("'", "\\'").replace('"', '\\"').replace('\n', '\\n')
-            js_code = f"addToTranscription('{escaped_text}');"
+            # json.dumps gives a correctly escaped JS string literal
+            text = "\n".join(lines)
+            js_code = f"addToTranscription({json.dumps(text)});"
             self.html_frame.evaluate_js(js_code)
         except Exception as e:
             print(f"Error adding to transcription: {e}")
@@ -183,7 +224,5 @@ The transcription box shows our conversation history."""
         pass
 
 
-# Compatibility alias
-class AppLauncherGUI(AppLauncherHTMLGUI):
-    """Maintains compatibility with existing interface"""
-    pass
\ No newline at end of file
+# Compatibility alias (same class, not a second definition)
+AppLauncherGUI = AppLauncherHTMLGUI
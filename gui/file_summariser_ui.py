@@ -1,11 +1,7 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
-
 # Define supported file types for the file summarizer
 SUPPORTED_FILE_TYPES = ['.txt', '.pdf', '.docx', '.csv']
 
@@ -26,8 +22,10 @@ class FileSummariserGUI:
 
     def setup_ui(self):
         """Set up the user interface for the file summarizer"""
-        self.root.title("File Summarizer (Test Mode)")
-        self.root.geometry("800x600")
+        # root may be a screen frame inside the main window
+        window = self.root.winfo_toplevel()
+        window.title("File Summarizer (Test Mode)")
+        window.geometry("800x600")
 
         # Main container
         container = tk.Frame(self.root)
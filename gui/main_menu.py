@@ -1,30 +1,43 @@
 import tkinter as tk
-from tkinterweb import HtmlFrame
-import sys
 from pathlib import Path
-import webview
-import threading
-import subprocess
-import platform
-import psutil
-
-# Add parent directory for imports
-sys.path.append(str(Path(__file__).parent.parent))
-
-# Import your module GUIs
-from gui.app_launcher_ui import AppLauncherHTMLGUI
-from gui.file_summariser_ui import FileSummariserGUI
-from core.desktop_organiser import DesktopOrganiserUI
-from core.app_launcher import (
-    open_chrome, open_safari, open_firefox, open_vscode, open_spotify,
-    open_notes, open_terminal, open_calculator, open_calendar,
-    quit_chrome, quit_safari, quit_vscode, quit_spotify, quit_notes,
-    quit_terminal, quit_calculator, quit_mail, quit_calendar
+
+# Module GUIs, the app launcher (psutil, process scans) and tkinterweb are imported where first
+# used, so the menu window shows without loading modules the user may never open
+
+# Fallback menu: (label, MainMenuGUI method) per button, sharing one style dict
+_MENU_BUTTONS = (
+    ("Desktop Organizer", "open_desktop_organizer"),
+    ("App Launcher", "open_app_launcher"),
+    ("File Summarizer", "open_file_summariser"),
 )
+_MENU_BUTTON_STYLE = {
+    "width": 25,
+    "height": 3,
+    "font": ("Segoe UI", 12, "bold"),
+    "bg": "#2d3246",
+    "fg": "#e6e9f0",
+    "relief": "flat",
+    "borderwidth": 0,
+    "cursor": "hand2",
+    "highlightthickness": 0
+}
+_EXIT_BUTTON_STYLE = {
+    "width": 15,
+    "height": 2,
+    "font": ("Segoe UI", 10),
+    "bg": "#ff6b6b",
+    "fg": "white",
+    "relief": "flat",
+    "borderwidth": 0,
+    "cursor": "hand2"
+}
 
 class MainMenuGUI:
     def __init__(self):
         self.window = None
+        # Tk screens: one frame per screen, built on first visit and re-packed afterwards
+        self._screens = {}
+        self._current_screen = None
 
     def run(self):
         """Run the application using webview"""
@@ -58,6 +71,10 @@ class MainMenuGUI:
     # App Launcher Commands
     def open_app(self, app_name):
         """Open an application by name"""
+        from core.app_launcher import (
+            open_chrome, open_safari, open_firefox, open_vscode, open_spotify,
+            open_notes, open_terminal, open_calculator, open_calendar
+        )
         try:
             if app_name == 'chrome':
                 open_chrome()
@@ -83,6 +100,10 @@ class MainMenuGUI:
 
     def quit_app(self, app_name):
         """Quit an application by name"""
+        from core.app_launcher import (
+            quit_chrome, quit_safari, quit_vscode, quit_spotify, quit_notes,
+            quit_terminal, quit_calculator, quit_calendar
+        )
         try:
             if app_name == 'chrome':
                 quit_chrome()
@@ -104,25 +125,47 @@ class MainMenuGUI:
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
 
+    def _show_screen(self, name, build):
+        """Hide the current screen and show `name`, calling build(frame) only on its first visit"""
+        if self._current_screen is not None:
+            self._screens[self._current_screen].pack_forget()
+            self._current_screen = None
+
+        frame = self._screens.get(name)
+        if frame is None:
+            frame = tk.Frame(self.root)
+            frame.pack(fill="both", expand=True)
+            try:
+                build(frame)
+            except Exception:
+                frame.destroy()
+                raise
+            self._screens[name] = frame
+        else:
+            frame.pack(fill="both", expand=True)
+        self._current_screen = name
+        return frame
+
     def setup_main_menu(self):
-        """Setup the main menu interface using HTML"""
-        # Clear existing widgets
-        for widget in self.root.winfo_children():
-            widget.destroy()
+        """Show the main menu interface (built from HTML on first use)"""
+        self._show_screen("menu", self._build_main_menu)
+
+    def _build_main_menu(self, parent):
+        """Build the main menu into its screen frame"""
+        html_path = Path(__file__).parent.parent / "deskpilot_ui.html"
+        if not html_path.exists():
+            self.setup_fallback_menu(parent)
+            return
 
         # Use HtmlFrame
-        self.html_frame = HtmlFrame(self.root, messages_enabled=False)
+        from tkinterweb import HtmlFrame
+        self.html_frame = HtmlFrame(parent, messages_enabled=False)
         self.html_frame.pack(fill="both", expand=True)
 
         # Load the HTML file
-        html_path = Path(__file__).parent.parent / "deskpilot_ui.html"
-        if html_path.exists():
-            self.html_frame.load_file(str(html_path))
-            # Apply dark theme
-            self.root.configure(bg='#1a1c25')
-        else:
-            self.setup_fallback_menu()
-            return
+        self.html_frame.load_file(str(html_path))
+        # Apply dark theme
+        self.root.configure(bg='#1a1c25')
 
         # Set up JavaScript to Python communication
         self.setup_js_bindings()
@@ -152,14 +195,10 @@ class MainMenuGUI:
         except Exception as e:
             print(f"Error setting up JS bindings: {e}")
 
-    def setup_fallback_menu(self):
+    def setup_fallback_menu(self, parent):
         """Fallback menu if HTML file is not available"""
-        # Clear existing widgets
-        for widget in self.root.winfo_children():
-            widget.destroy()
-
         # Main menu frame
-        main_frame = tk.Frame(self.root, bg="#1a1c25")
+        main_frame = tk.Frame(parent, bg="#1a1c25")
         main_frame.pack(fill="both", expand=True)
 
         # Title
@@ -186,68 +225,25 @@ class MainMenuGUI:
         button_frame = tk.Frame(main_frame, bg="#1a1c25")
         button_frame.pack(pady=20)
 
-        # Button style
-        btn_style = {
-            "width": 25,
-            "height": 3,
-            "font": ("Segoe UI", 12, "bold"),
-            "bg": "#2d3246",
-            "fg": "#e6e9f0",
-            "relief": "flat",
-            "borderwidth": 0,
-            "cursor": "hand2",
-            "highlightthickness": 0
-        }
-
         # Menu buttons
-        desktop_organizer_btn = tk.Button(
-            button_frame,
-            text="Desktop Organizer",
-            command=self.open_desktop_organizer,
-            **btn_style
-        )
-        desktop_organizer_btn.pack(pady=15)
-
-        app_launcher_btn = tk.Button(
-            button_frame,
-            text="App Launcher",
-            command=self.open_app_launcher,
-            **btn_style
-        )
-        app_launcher_btn.pack(pady=15)
-
-        file_summarizer_btn = tk.Button(
-            button_frame,
-            text="File Summarizer",
-            command=self.open_file_summarizer,
-            **btn_style
-        )
-        file_summarizer_btn.pack(pady=15)
+        for text, method_name in _MENU_BUTTONS:
+            self._make_button(button_frame, text, getattr(self, method_name), _MENU_BUTTON_STYLE, pady=15)
 
         # Exit button
-        exit_btn = tk.Button(
-            button_frame,
-            text="Exit",
-            command=self.root.quit,
-            width=15,
-            height=2,
-            font=("Segoe UI", 10),
-            bg="#ff6b6b",
-            fg="white",
-            relief="flat",
-            borderwidth=0,
-            cursor="hand2"
-        )
-        exit_btn.pack(pady=(30, 0))
+        self._make_button(button_frame, "Exit", self.root.quit, _EXIT_BUTTON_STYLE, pady=(30, 0))
+
+    @staticmethod
+    def _make_button(parent, text, command, style, pady):
+        """Create and pack one menu button from a shared style dict"""
+        button = tk.Button(parent, text=text, command=command, **style)
+        button.pack(pady=pady)
+        return button
 
     def open_desktop_organizer(self):
         """Open Desktop Organizer module"""
         try:
-            # Clear current widgets
-            for widget in self.root.winfo_children():
-                widget.destroy()
-
-            # Create Desktop Organizer UI
+            # Opens in the browser, so the menu stays up
+            from core.desktop_organiser import DesktopOrganiserUI
             self.desktop_organizer = DesktopOrganiserUI(self.root, self)
         except Exception as e:
             print(f"Error opening Desktop Organizer: {e}")
@@ -256,12 +252,13 @@ class MainMenuGUI:
     def open_app_launcher(self):
         """Open App Launcher module"""
         try:
-            # Clear current widgets
-            for widget in self.root.winfo_children():
-                widget.destroy()
+            # Create App Launcher UI on first visit, then just show it again
+            from gui.app_launcher_ui import AppLauncherHTMLGUI
+
+            def build(frame):
+                self.app_launcher = AppLauncherHTMLGUI(frame, self)
 
-            # Create App Launcher UI
-            self.app_launcher = AppLauncherHTMLGUI(self.root, self)
+            self._show_screen("launcher", build)
         except Exception as e:
             print(f"Error opening App Launcher: {e}")
             self.setup_main_menu()
@@ -269,12 +266,13 @@ class MainMenuGUI:
     def open_file_summariser(self):
         """Open File Summariser module"""
         try:
-            # Clear current widgets
-            for widget in self.root.winfo_children():
-                widget.destroy()
+            # Create File Summarizer UI on first visit, then just show it again
+            from gui.file_summariser_ui import FileSummariserGUI
 
-            # Create File Summarizer UI
-            self.file_summariser = FileSummariserGUI(self.root, self)
+            def build(frame):
+                self.file_summariser = FileSummariserGUI(frame, self)
+
+            self._show_screen("summariser", build)
         except Exception as e:
             print(f"Error opening File Summariser: {e}")
             self.setup_main_menu()
@@ -283,13 +281,14 @@ class MainMenuGUI:
         """Load HTML UI from file"""
         html_path = Path(__file__).parent.parent / html_file
         if html_path.exists():
-            # Clear current widgets
-            for widget in self.root.winfo_children():
-                widget.destroy()
-
-            # Create HTML frame
-            html_frame = HtmlFrame(self.root, messages_enabled=False)
-            html_frame.pack(fill="both", expand=True)
-            html_frame.load_file(str(html_path))
+            # Create HTML frame (once per file)
+            from tkinterweb import HtmlFrame
+
+            def build(frame):
+                html_frame = HtmlFrame(frame, messages_enabled=False)
+                html_frame.pack(fill="both", expand=True)
+                html_frame.load_file(str(html_path))
+
+            self._show_screen(html_file, build)
         else:
             print(f"HTML file not found: {html_file}")
\ No newline at end of file
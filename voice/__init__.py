@@ -0,0 +1 @@
+"""DeskPilot voice input and output."""
@@ -1,9 +1,29 @@
 import speech_recognition as sr
-import sys
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.append(str(Path(__file__).parent.parent))
+# Shared so an ambient-noise calibration done ahead of time carries over to the next listen
+_recognizer = None
+_precalibrated = False
+
+
+def _get_recognizer():
+    global _recognizer
+    if _recognizer is None:
+        _recognizer = sr.Recognizer()
+    return _recognizer
+
+
+def calibrate(duration=1):
+    """
+    Measure ambient noise now (e.g. while a GPT greeting is being fetched) so the next
+    listen_command can skip its own calibration and start listening straight away.
+    """
+    global _precalibrated
+    try:
+        with sr.Microphone() as source:
+            _get_recognizer().adjust_for_ambient_noise(source, duration=duration)
+        _precalibrated = True
+    except Exception as e:
+        print(f"Ambient noise calibration failed: {e}")
 
 
 def listen_command(timeout=5, phrase_time_limit=10):
@@ -17,14 +37,18 @@ def listen_command(timeout=5, phrase_time_limit=10):
     Returns:
         str: Transcribed command in lowercase, or empty string on error
     """
-    recognizer = sr.Recognizer()
+    global _precalibrated
+    recognizer = _get_recognizer()
 
     with sr.Microphone() as source:
         print("Listening for command...")
 
         try:
-            # Adjust for ambient noise
-            recognizer.adjust_for_ambient_noise(source, duration=1)
+            # Adjust for ambient noise, unless calibrate() just did
+            if _precalibrated:
+                _precalibrated = False
+            else:
+                recognizer.adjust_for_ambient_noise(source, duration=1)
 
             # Listen for audio
             audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
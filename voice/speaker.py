@@ -4,15 +4,12 @@ Speaker module for DeskPilot using ElevenLabs TTS
 """
 
 import os
+import atexit
 import threading
 import time
-from pathlib import Path
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
-
 # Load environment variables
 load_dotenv()
 
@@ -35,6 +32,13 @@ except ImportError as e:
 # Global transcription log reference (set by GUI)
 TRANSCRIPTION_LOG = None
 
+# Lines kept in the transcription log; older ones are trimmed so insert/see cost stays flat over a session
+_MAX_TRANSCRIPTION_LINES = 500
+
+# Single persistent TTS worker: callers return immediately and utterances play in order
+_TTS_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DeskPilotTTS")
+atexit.register(_TTS_POOL.shutdown, wait=True)
+
 
 class VoiceSpeaker:
     """Handles text-to-speech using ElevenLabs API - FIXED to prevent feedback"""
@@ -42,7 +46,6 @@ class VoiceSpeaker:
     def __init__(self):
         self.is_speaking = False
         self.speaking_lock = threading.Lock()
-        self._speech_finished_callback = None  # NEW: Callback for when speech finishes
 
         # Get API credentials from environment
         self.api_key = os.getenv("ELEVENLABS_API_KEY")
@@ -88,15 +91,17 @@ class VoiceSpeaker:
 
         print(f"🎤 DeskPilot says: {text}")
 
-        # Store callback
-        self._speech_finished_callback = on_finished_callback
-
         # Log to transcription if available
         if log_to_transcription and TRANSCRIPTION_LOG:
             try:
                 def add_to_log():
                     TRANSCRIPTION_LOG.config(state="normal")
                     TRANSCRIPTION_LOG.insert("end", f"(DeskPilot) says: {text}\n")
+                    # end-1c sits on the empty line after the last "\n", so logged lines are one fewer
+                    count = int(TRANSCRIPTION_LOG.index("end-1c").split(".")[0]) - 1
+                    if count > _MAX_TRANSCRIPTION_LINES:
+                        # Delete up to (not including) the first line to keep
+                        TRANSCRIPTION_LOG.delete("1.0", f"{count - _MAX_TRANSCRIPTION_LINES + 1}.0")
                     TRANSCRIPTION_LOG.see("end")
                     TRANSCRIPTION_LOG.config(state="disabled")
 
@@ -108,11 +113,11 @@ class VoiceSpeaker:
             except Exception as e:
                 print(f"Failed to log to transcription: {e}")
 
-        # Start speaking in a separate thread to avoid blocking
-        threading.Thread(target=self._speak_threaded, args=(text,), daemon=True).start()
+        # Queue on the TTS worker so we don't block; the callback travels with its own utterance
+        _TTS_POOL.submit(self._speak_threaded, text, on_finished_callback)
 
-    def _speak_threaded(self, text):
-        """Internal method to handle TTS in a separate thread - FIXED with proper callback"""
+    def _speak_threaded(self, text, on_finished_callback=None):
+        """Internal method to handle TTS on the TTS worker thread - FIXED with proper callback"""
         with self.speaking_lock:
             if self.is_speaking:
                 return  # Already speaking
@@ -134,13 +139,16 @@ class VoiceSpeaker:
                 self.is_speaking = False
 
                 # FIXED: Call the callback when speech is completely finished
-                if self._speech_finished_callback:
-                    try:
-                        self._speech_finished_callback()
-                    except Exception as e:
-                        print(f"❌ Callback error: {e}")
-                    finally:
-                        self._speech_finished_callback = None
+                if on_finished_callback:
+                    # Run off the TTS worker so a callback that speaks again can't deadlock it
+                    threading.Thread(target=self._run_callback, args=(on_finished_callback,), daemon=True).start()
+
+    def _run_callback(self, callback):
+        """Invoke a speech-finished callback, logging any error"""
+        try:
+            callback()
+        except Exception as e:
+            print(f"❌ Callback error: {e}")
 
     def _speak_elevenlabs(self, text):
         """Use ElevenLabs TTS - exactly like your working code"""
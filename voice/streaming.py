@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Streaming speech capture for DeskPilot: VAD-gated utterances transcribed on-device.
+
+A background thread reads 30 ms microphone frames, WebRTC VAD gates them into
+utterances, and each finished utterance is queued for faster-whisper. Falls back
+to the blocking voice.listener functions when the optional packages are missing.
+"""
+
+import atexit
+import functools
+import queue
+import threading
+import time
+from collections import deque
+
+from .listener import listen_command as _blocking_listen, calibrate as _blocking_calibrate
+
+try:
+    import numpy as np
+    import pyaudio
+    import webrtcvad
+    from faster_whisper import WhisperModel
+
+    STREAMING_AVAILABLE = True
+except ImportError as e:
+    STREAMING_AVAILABLE = False
+    print(f"Streaming speech capture not available, using blocking listener: {e}")
+
+# 16 kHz mono 16-bit PCM in 30 ms frames (a frame size WebRTC VAD accepts)
+_SAMPLE_RATE = 16000
+_FRAME_MS = 30
+_FRAME_SAMPLES = _SAMPLE_RATE * _FRAME_MS // 1000
+
+# Speech starts once most of the last 300 ms is voiced, and ends after 300 ms of silence
+_PADDING_FRAMES = 10
+_TRIGGER_RATIO = 0.6
+_SILENCE_MS = 300
+_MAX_UTTERANCE_S = 12
+
+# How often a waiting listen() checks that the capture thread is still running
+_ALIVE_POLL_S = 0.5
+
+_WHISPER_MODEL = "base"
+
+# The warm-up thread and the first listen may both ask for the model; only one loads it
+_model = None
+_model_lock = threading.Lock()
+
+
+def _get_model():
+    """faster-whisper model, loaded once (int8 keeps it fast on CPU)."""
+    global _model
+    with _model_lock:
+        if _model is None:
+            _model = WhisperModel(_WHISPER_MODEL, compute_type="int8")
+        return _model
+
+
+class StreamingListener:
+    """Keeps the microphone open and queues (trigger_time, pcm_bytes) for each utterance"""
+
+    def __init__(self, aggressiveness=2, silence_ms=_SILENCE_MS, max_utterance_s=_MAX_UTTERANCE_S):
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self._silence_frames = max(1, silence_ms // _FRAME_MS)
+        self._max_frames = max_utterance_s * 1000 // _FRAME_MS
+        self._utterances = queue.Queue()
+        self._stop = threading.Event()
+        self._audio = None
+        self._stream = None
+        self._thread = None
+
+    def start(self):
+        """Open the microphone and start capturing; the Whisper model loads in the background"""
+        self._audio = pyaudio.PyAudio()
+        self._stream = self._audio.open(format=pyaudio.paInt16, channels=1, rate=_SAMPLE_RATE,
+                                        input=True, frames_per_buffer=_FRAME_SAMPLES)
+        self._thread = threading.Thread(target=self._capture, name="DeskPilotVAD", daemon=True)
+        self._thread.start()
+        threading.Thread(target=_get_model, daemon=True).start()
+
+    def stop(self):
+        """Stop capturing and release the microphone"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+        try:
+            if self._stream is not None:
+                self._stream.stop_stream()
+                self._stream.close()
+            if self._audio is not None:
+                self._audio.terminate()
+        except Exception as e:
+            print(f"Error closing microphone stream: {e}")
+
+    def _capture(self):
+        """Producer: VAD-gate microphone frames into whole utterances"""
+        ring = deque(maxlen=_PADDING_FRAMES)
+        frames = []
+        triggered = False
+        silence = 0
+        triggered_at = 0.0
+
+        while not self._stop.is_set():
+            try:
+                frame = self._stream.read(_FRAME_SAMPLES, exception_on_overflow=False)
+                speech = self._vad.is_speech(frame, _SAMPLE_RATE)
+            except Exception as e:
+                print(f"Microphone read failed: {e}")
+                break
+
+            if not triggered:
+                ring.append((frame, speech))
+                if sum(s for _, s in ring) > _TRIGGER_RATIO * ring.maxlen:
+                    # Keep the padding so the first syllable isn't clipped; the utterance is timed
+                    # from the trigger, since the padding may predate the listen() waiting for it
+                    triggered = True
+                    triggered_at = time.monotonic()
+                    frames = [f for f, _ in ring]
+                    ring.clear()
+                    silence = 0
+            else:
+                frames.append(frame)
+                silence = 0 if speech else silence + 1
+                if silence >= self._silence_frames or len(frames) >= self._max_frames:
+                    self._utterances.put((triggered_at, b"".join(frames)))
+                    triggered = False
+                    frames = []
+
+    def listen(self, timeout=5, phrase_time_limit=10):
+        """
+        Wait for the next utterance that VAD picked up after this call and transcribe it.
+        Utterances already queued (e.g. our own TTS being picked up) are discarded.
+
+        Returns:
+            str: Transcribed command in lowercase, or empty string on timeout/error
+        Raises RuntimeError if the capture thread has died (e.g. the microphone went away).
+        """
+        self._check_alive()
+        since = time.monotonic()
+        deadline = since + timeout + phrase_time_limit
+        print("Listening for command...")
+
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                # Wake up now and then so a capture thread dying mid-wait is noticed
+                triggered_at, pcm = self._utterances.get(timeout=min(remaining, _ALIVE_POLL_S))
+            except queue.Empty:
+                if remaining > _ALIVE_POLL_S:
+                    self._check_alive()
+                    continue
+                print("Listening timeout - no speech detected")
+                return ""
+            if triggered_at >= since:
+                break
+
+        try:
+            audio = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+            segments, _ = _get_model().transcribe(audio, beam_size=1, language="en")
+            query = "".join(seg.text for seg in segments).strip()
+        except Exception as e:
+            print(f"Error in speech recognition: {e}")
+            return ""
+
+        print(f"You said: {query}")
+        return query.lower()
+
+    def _check_alive(self):
+        """Drop this listener and raise if capture has stopped, so callers fall back to the blocking one"""
+        if self._thread is None or not self._thread.is_alive():
+            _get_streaming_listener.cache_clear()
+            self.stop()
+            raise RuntimeError("microphone capture stopped")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_streaming_listener():
+    listener = StreamingListener()
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def listen_command(timeout=5, phrase_time_limit=10):
+    """
+    Listen for a voice command; same contract as voice.listener.listen_command.
+    Uses the streaming VAD pipeline when available, otherwise the blocking listener.
+    """
+    if STREAMING_AVAILABLE:
+        try:
+            return _get_streaming_listener().listen(timeout, phrase_time_limit)
+        except Exception as e:
+            print(f"Streaming listener failed, using blocking listener: {e}")
+    return _blocking_listen(timeout=timeout, phrase_time_limit=phrase_time_limit)
+
+
+def calibrate(duration=1):
+    """Ambient-noise calibration for the blocking listener; VAD gating doesn't need it."""
+    if not STREAMING_AVAILABLE:
+        _blocking_calibrate(duration)
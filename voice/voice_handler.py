@@ -2,30 +2,27 @@
 Voice Handler for DeskPilot - Prevents feedback loops
 """
 
-from voice.speaker import speak_and_wait, speak
-from voice.listener import listen_command
+from .speaker import speak_and_wait, speak
+from .streaming import listen_command, calibrate
+import asyncio
+import re
 import time
-import sys
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
 
 try:
     from core.app_launcher import (
-        AppLauncher,
+        _get_launcher,
         launch_app_by_voice,
         quit_app_by_voice
     )
 except ImportError:
     print("⚠️ App launcher not available")
-    AppLauncher = None
+    _get_launcher = None
 
 # GPT integration (optional)
 try:
-    from gpt import GPTHandler
+    from gpt import get_gpt_handler
 except Exception:
-    GPTHandler = None
+    get_gpt_handler = None
 
 # Names from config (optional for fallbacks)
 try:
@@ -33,15 +30,94 @@ try:
 except Exception:
     ASSISTANT_NAME, USER_NAME = "DeskPilot", "sir"
 
+# pyahocorasick (optional): finds every keyword intent in one pass over a command
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# GPT-interpreted actions that map to launching / quitting
+_OPEN_ACTIONS = frozenset({'open', 'launch', 'start', 'run'})
+_QUIT_ACTIONS = frozenset({'quit', 'close', 'stop', 'exit'})
+
+
+def _phrase_regex(phrases):
+    """One alternation over the phrases; plain substring matching, as with the old any(... in ...) checks."""
+    return re.compile("|".join(re.escape(p) for p in phrases))
+
+
+# Keyword fallbacks per intent; process_command checks intents in this order
+_INTENT_PHRASES = {
+    "open": ("open", "launch", "start", "run", "bring up", "pull up", "fire up", "boot up", "pop open"),
+    "quit": ("quit", "close", "exit", "stop", "shut down", "close out", "end", "terminate", "dismiss", "kill"),
+    "running": ("running", "currently open", "what's running", "what is running", "what's open",
+                "what is open", "applications", "apps", "rundown"),
+    "identity": ("who are you", "what can you do", "your capabilities", "capabilities", "functions",
+                 "what are your functions", "what are your capabilities", "tell me about yourself",
+                 "introduce yourself", "what do you do", "what are you"),
+    "help": ("help", "what can you do", "commands", "assist"),
+}
+
+# One automaton over every intent phrase: a single pass finds all intents a command mentions
+_INTENT_AC = None
+if AHOCORASICK_AVAILABLE:
+    _phrase_intents = {}
+    for _intent, _phrases in _INTENT_PHRASES.items():
+        for _phrase in _phrases:
+            _phrase_intents.setdefault(_phrase, set()).add(_intent)
+    _INTENT_AC = ahocorasick.Automaton()
+    for _phrase, _intents in _phrase_intents.items():
+        _INTENT_AC.add_word(_phrase, frozenset(_intents))
+    _INTENT_AC.make_automaton()
+    del _phrase_intents
+
+# Without pyahocorasick: one regex per intent
+_INTENT_RES = {intent: _phrase_regex(phrases) for intent, phrases in _INTENT_PHRASES.items()}
+
+
+def _is_name_query(command_lower):
+    """Whether the command asks for the assistant's name, e.g. 'what is your name?'"""
+    return "your name" in command_lower or (
+        "name?" in command_lower and ("your" in command_lower or command_lower.startswith("name")))
+
+
+def _match_intents(command_lower):
+    """Set of keyword intents whose phrases appear anywhere in the command"""
+    if _INTENT_AC is not None:
+        intents = set()
+        for _, matched in _INTENT_AC.iter(command_lower):
+            intents |= matched
+        return intents
+    return {intent for intent, regex in _INTENT_RES.items() if regex.search(command_lower)}
+
+
+# Running-apps follow-ups: yes/no for one app, and which apps are open
+_IS_APP_OPEN_RE = re.compile(r"^is\s+(.+?)\s+(?:currently\s+)?(open|running)\??$")
+_LIST_RE = _phrase_regex(("which apps", "which applications", "what apps", "what applications",
+                          "what's open", "what is open", "what's running", "what is running",
+                          "show apps", "list apps", "running apps", "running applications", "rundown"))
+
+_WAKE_RE = _phrase_regex(("desk pilot", "deskpilot", "hey pilot"))
+
+# A GPT greeting is reused for this long, so rapid speak presses don't each pay a round-trip
+_GREETING_TTL = 60.0
+
 
 class VoiceHandler:
     """Handles the voice interaction flow, delegating app logic to app_launcher.py"""
 
-    def __init__(self):
+    def __init__(self, app_launcher=None, gpt_handler=None):
         self.listening = False
-        self.app_launcher = AppLauncher() if AppLauncher else None
-        # Lazy GPT handler for dynamic greetings
-        self.gpt_handler = GPTHandler() if GPTHandler else None
+        # Process-wide launcher and GPT handler unless the caller passes its own
+        if app_launcher is None and _get_launcher:
+            app_launcher = _get_launcher()
+        if gpt_handler is None and get_gpt_handler:
+            gpt_handler = get_gpt_handler()
+        self.app_launcher = app_launcher
+        # GPT handler for dynamic greetings
+        self.gpt_handler = gpt_handler
         # Local rotating greetings as examples/fallbacks
         self._greeting_pool = [
             "DeskPilot, at your service sir.",
@@ -50,15 +126,34 @@ class VoiceHandler:
             "What will it be today, sir — opening apps, or shall I show what's currently running?",
         ]
         self._greet_index = 0
+        # (greeting, monotonic time fetched) for the last GPT greeting
+        self._cached_greeting = None
+        # Keyword intent -> handler, in priority order
+        self._dispatch = (
+            ("open", self._handle_open),
+            ("quit", self._handle_quit),
+            ("running", self._handle_running),
+            ("name", self._handle_name),
+            ("identity", self._handle_identity),
+            ("help", self._handle_help),
+        )
 
     def _get_dynamic_greeting(self):
         """Return a varied greeting using GPT when available, otherwise cycle local examples."""
+        # Reuse a recent GPT greeting
+        cached = self._cached_greeting
+        if cached and time.monotonic() - cached[1] < _GREETING_TTL:
+            return cached[0]
         # Try GPT-driven dynamic prompt first
         if self.gpt_handler:
             try:
                 prompt = self.gpt_handler.get_dynamic_prompt()
                 if prompt and isinstance(prompt, str) and prompt.strip():
-                    return prompt.strip()
+                    prompt = prompt.strip()
+                    # Error replies ("Sorry sir, ...") are no greeting; use the local pool instead
+                    if not prompt.startswith(f"Sorry {USER_NAME}"):
+                        self._cached_greeting = (prompt, time.monotonic())
+                        return prompt
             except Exception as _e:
                 print(f"GPT dynamic greeting failed: {_e}")
         # Fallback: simple rotation through local pool
@@ -70,10 +165,18 @@ class VoiceHandler:
 
     def start_voice_interaction(self):
         """Start voice flow with proper TTS/listen sequence"""
-        greet = self._get_dynamic_greeting()
+        greet = asyncio.run(self._prepare_session())
         speak_and_wait(greet)
         self.listen_for_command()
 
+    async def _prepare_session(self):
+        """Fetch the greeting (GPT round-trip) while the microphone calibrates; both finish before we speak."""
+        greet, _ = await asyncio.gather(
+            asyncio.to_thread(self._get_dynamic_greeting),
+            asyncio.to_thread(calibrate),
+        )
+        return greet
+
     def start_voice_interaction_with_callback(self):
         """Alternative callback-based voice start"""
 
@@ -125,19 +228,11 @@ class VoiceHandler:
                 interp = self.gpt_handler.interpret_app_command(command)
                 action = (interp.get('action') or 'unknown').lower()
                 app = interp.get('app') or 'none'
-                if action in ['open', 'launch', 'start', 'run'] and app != 'none':
-                    result = launch_app_by_voice(command, self.gpt_handler)
-                    speak_and_wait(result['message'])
-                    if not result['success']:
-                        self.listen_for_command()
-                    return
-                if action in ['quit', 'close', 'stop', 'exit'] and app != 'none':
-                    result = quit_app_by_voice(command, self.gpt_handler)
-                    speak_and_wait(result['message'])
-                    if not result['success']:
-                        self.listen_for_command()
-                    return
-                if action in ['list'] or ('running' in command_lower and ('app' in command_lower or 'applications' in command_lower or 'apps' in command_lower)):
+                if action in _OPEN_ACTIONS and app != 'none':
+                    return self._handle_open(command, command_lower)
+                if action in _QUIT_ACTIONS and app != 'none':
+                    return self._handle_quit(command, command_lower)
+                if action == 'list' or ('running' in command_lower and 'app' in command_lower):
                     # Treat as running apps inquiry
                     if not self.app_launcher:
                         speak_and_wait("Sorry sir, I can't access running applications right now.")
@@ -145,100 +240,97 @@ class VoiceHandler:
             except Exception as _e:
                 print(f"GPT pre-parse failed: {_e}")
 
-        # Open/launch/start commands (keyword fallback)
-        if any(word in command_lower for word in ["open", "launch", "start", "run", "bring up", "pull up", "fire up", "boot up", "pop open"]):
-            result = launch_app_by_voice(command, self.gpt_handler)
-            speak_and_wait(result['message'])
-            if not result['success']:
-                self.listen_for_command()  # Ask again if failed
+        # Keyword fallback: the first intent in dispatch order that the command mentions wins
+        intents = _match_intents(command_lower)
+        if _is_name_query(command_lower):
+            intents.add("name")
+        for intent, handler in self._dispatch:
+            if intent in intents:
+                return handler(command, command_lower)
 
-        # Quit/close/exit/stop commands (keyword fallback)
-        elif any(word in command_lower for word in ["quit", "close", "exit", "stop", "shut down", "close out", "end", "terminate", "dismiss", "kill"]):
-            result = quit_app_by_voice(command, self.gpt_handler)
+        # Default response
+        speak_and_wait(
+            "I'm not sure how to help with that, sir. You can ask me to open apps, close apps, or check what's running."
+        )
+        self.listen_for_command()
+
+    def _handle_open(self, command, command_lower):
+        """Open/launch/start commands"""
+        result = launch_app_by_voice(command, self.gpt_handler)
+        speak_and_wait(result['message'])
+        if not result['success']:
+            self.listen_for_command()  # Ask again if failed
+
+    def _handle_quit(self, command, command_lower):
+        """Quit/close/exit/stop commands"""
+        result = quit_app_by_voice(command, self.gpt_handler)
+        speak_and_wait(result['message'])
+        if not result['success']:
+            self.listen_for_command()  # Ask again if failed
+
+    def _handle_running(self, command, command_lower):
+        """Running apps inquiries (how many / which / is <app> open?)"""
+        if not self.app_launcher:
+            speak_and_wait("Sorry sir, I can't access running applications right now.")
+            return
+
+        # 1) Yes/No for specific app: e.g., "is google chrome open?" / "is spotify running?"
+        m = _IS_APP_OPEN_RE.search(command_lower)
+        if m:
+            app_phrase = m.group(1).strip()
+            result = self.app_launcher.check_app_running_message(app_phrase)
             speak_and_wait(result['message'])
-            if not result['success']:
-                self.listen_for_command()  # Ask again if failed
-
-        # Running apps inquiries (how many / which / is <app> open?)
-        elif any(kw in command_lower for kw in ["running", "currently open", "what's running", "what is running", "what's open", "what is open", "applications", "apps", "rundown"]):
-            if not self.app_launcher:
-                speak_and_wait("Sorry sir, I can't access running applications right now.")
-                return
-
-            # 1) Yes/No for specific app: e.g., "is google chrome open?" / "is spotify running?"
-            import re as _re
-            m = _re.search(r"^is\s+(.+?)\s+(?:currently\s+)?(open|running)\??$", command_lower)
-            if m:
-                app_phrase = m.group(1).strip()
-                result = self.app_launcher.check_app_running_message(app_phrase)
-                speak_and_wait(result['message'])
-                return
-
-            # 2) How many apps are open?
-            if ("how many" in command_lower) and ("app" in command_lower or "application" in command_lower or "applications" in command_lower or "apps" in command_lower):
-                summary = self.app_launcher.get_running_apps_summary()
-                # Enforce the exact phrasing requested
-                speak_and_wait(f"You have {summary['count']} applications open sir")
-                return
-
-            # 3) Which/what apps are open?
-            list_triggers = [
-                "which apps", "which applications", "what apps", "what applications",
-                "what's open", "what is open", "what's running", "what is running",
-                "show apps", "list apps", "running apps", "running applications", "rundown"
-            ]
-            if any(t in command_lower for t in list_triggers):
-                sentence = self.app_launcher.running_apps_list_sentence()
-                speak_and_wait(sentence)
-                return
-
-            # Fallback: generic summary
+            return
+
+        # 2) How many apps are open?
+        if "how many" in command_lower and "app" in command_lower:
             summary = self.app_launcher.get_running_apps_summary()
-            speak_and_wait(summary['message'])
+            # Enforce the exact phrasing requested
+            speak_and_wait(f"You have {summary['count']} applications open sir")
+            return
 
-        # Assistant name queries (e.g., "what is your name?")
-        elif ("your name" in command_lower) or ("what's your name" in command_lower) or ("what is your name" in command_lower) or ("name?" in command_lower and ("your" in command_lower or command_lower.startswith("name"))):
-            try:
-                if self.gpt_handler:
-                    response = self.gpt_handler.get_name_response()
-                else:
-                    response = f"My name is {ASSISTANT_NAME}, {USER_NAME}."
-                speak_and_wait(response)
-            finally:
-                self.listen_for_command()
+        # 3) Which/what apps are open?
+        if _LIST_RE.search(command_lower):
+            sentence = self.app_launcher.running_apps_list_sentence()
+            speak_and_wait(sentence)
+            return
 
-        # Identity / capabilities queries
-        elif any(phrase in command_lower for phrase in [
-            "who are you", "what can you do", "your capabilities", "capabilities", "functions",
-            "what are your functions", "what are your capabilities", "tell me about yourself",
-            "introduce yourself", "what do you do", "what are you"
-        ]):
-            try:
-                if self.gpt_handler:
-                    response = self.gpt_handler.get_identity_response()
-                else:
-                    response = (
-                        f"I am {ASSISTANT_NAME} {USER_NAME}, an interactive artificial intelligence system serving as your personal assistant to help with your desktop needs on your operating system. "
-                        "I can open apps, close apps, or check what's currently running."
-                    )
-                speak_and_wait(response)
-            finally:
-                self.listen_for_command()
+        # Fallback: generic summary
+        summary = self.app_launcher.get_running_apps_summary()
+        speak_and_wait(summary['message'])
 
-        # Help/assistance
-        elif any(phrase in command_lower for phrase in ["help", "what can you do", "commands", "assist"]):
-            speak_and_wait(
-                "I can help you open applications, close applications, and check what's currently running, sir. What would you like me to do?"
-            )
+    def _handle_name(self, command, command_lower):
+        """Assistant name queries (e.g., "what is your name?")"""
+        try:
+            if self.gpt_handler:
+                response = self.gpt_handler.get_name_response()
+            else:
+                response = f"My name is {ASSISTANT_NAME}, {USER_NAME}."
+            speak_and_wait(response)
+        finally:
             self.listen_for_command()
 
-        # Default response
-        else:
-            speak_and_wait(
-                "I'm not sure how to help with that, sir. You can ask me to open apps, close apps, or check what's running."
-            )
+    def _handle_identity(self, command, command_lower):
+        """Identity / capabilities queries"""
+        try:
+            if self.gpt_handler:
+                response = self.gpt_handler.get_identity_response()
+            else:
+                response = (
+                    f"I am {ASSISTANT_NAME} {USER_NAME}, an interactive artificial intelligence system serving as your personal assistant to help with your desktop needs on your operating system. "
+                    "I can open apps, close apps, or check what's currently running."
+                )
+            speak_and_wait(response)
+        finally:
             self.listen_for_command()
 
+    def _handle_help(self, command, command_lower):
+        """Help/assistance"""
+        speak_and_wait(
+            "I can help you open applications, close applications, and check what's currently running, sir. What would you like me to do?"
+        )
+        self.listen_for_command()
+
 
 # Convenience functions for easy integration
 def start_voice_session():
@@ -261,14 +353,16 @@ def continuous_voice_mode():
             if not command:
                 continue
 
+            command_lower = command.lower()
+
             # Wake word detection
-            if any(wake in command.lower() for wake in ["desk pilot", "deskpilot", "hey pilot"]):
+            if _WAKE_RE.search(command_lower):
                 speak_and_wait("Yes sir?")
                 actual_command = listen_command(timeout=10, phrase_time_limit=15)
                 if actual_command:
                     voice_handler.process_command(actual_command)
 
-            elif "stop listening" in command.lower():
+            elif "stop listening" in command_lower:
                 speak_and_wait("Voice mode deactivated, sir.")
                 break
 